@@ -0,0 +1,255 @@
+import itertools
+import logging
+
+import numpy as np
+import pandas as pd
+
+from scripts.market_time import session_dates
+from scripts.technical_indicators import calculate_technical_indicators
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+TRADING_DAYS_PER_YEAR = 252
+
+# Numeric score used for each sentiment label when trading on 'sentiment_label'
+LABEL_SCORES = {'Negative': -1.0, 'Neutral': 0.0, 'Positive': 1.0}
+
+
+def build_price_panel(stock_frames, with_indicators=True):
+    """
+    Assemble per-ticker stock frames into date x ticker panels.
+
+    Parameters:
+        stock_frames (dict): Mapping of ticker to a DataFrame as returned by
+            `prepare_stock_data` (DatetimeIndex, 'Close' column).
+        with_indicators (bool): Also build 'SMA_50' and 'RSI' panels using
+            `calculate_technical_indicators`.
+
+    Returns:
+        dict: Panels keyed by 'Close' (and 'SMA_50', 'RSI'), each a DataFrame indexed
+        by date with one column per ticker.
+    """
+    try:
+        if not stock_frames:
+            raise ValueError("stock_frames must contain at least one ticker.")
+
+        columns = ['Close', 'SMA_50', 'RSI'] if with_indicators else ['Close']
+        per_ticker = {}
+        for ticker, df in stock_frames.items():
+            if 'Close' not in df.columns:
+                raise ValueError(f"Stock data for '{ticker}' must contain a 'Close' column.")
+            if with_indicators:
+                df = calculate_technical_indicators(df)
+            per_ticker[ticker] = df[columns]
+
+        # One concat + unstack instead of joining tickers one at a time
+        stacked = pd.concat(per_ticker, names=['ticker', 'date'])
+        panels = {col: stacked[col].unstack('ticker').sort_index() for col in columns}
+
+        logging.info(f"Price panel built for {len(per_ticker)} tickers.")
+        return panels
+
+    except Exception as e:
+        logging.error(f"Error building price panel: {e}")
+        raise
+
+
+def build_sentiment_panel(news_df, dates, tickers, value_col='sentiment', ticker_col='stock', date_col='date'):
+    """
+    Aggregate per-headline sentiment into a date x ticker panel aligned to trading dates.
+
+    Publication times are converted to New York time. Headlines published before the
+    16:00 close go to the first trading date on or after their publication date;
+    later ones go to the next trading date, since that day's close has already
+    happened. Headlines whose session date falls before the first or after the last
+    panel date are dropped rather than piled onto the panel's edges. Scores are
+    averaged per (date, ticker); days without news score 0.
+
+    Parameters:
+        news_df (pd.DataFrame): News data with sentiment scores or labels.
+        dates (pd.DatetimeIndex): Trading dates of the price panel.
+        tickers (list): Tickers (columns) of the price panel.
+        value_col (str): 'sentiment' for numeric scores or 'sentiment_label' for labels.
+        ticker_col (str): Column holding the ticker symbol.
+        date_col (str): Column holding the publication date.
+
+    Returns:
+        pd.DataFrame: Mean sentiment per trading date and ticker.
+    """
+    try:
+        missing = {value_col, ticker_col, date_col} - set(news_df.columns)
+        if missing:
+            raise ValueError(f"news_df is missing required column(s): {missing}")
+
+        if value_col == 'sentiment_label':
+            values = news_df[value_col].astype(str).map(LABEL_SCORES)
+        else:
+            values = pd.to_numeric(news_df[value_col], errors='coerce')
+
+        published = session_dates(news_df[date_col])
+
+        dates = pd.DatetimeIndex(dates)
+        published = published.to_numpy()
+        position = dates.searchsorted(published)
+        # News older than the panel would otherwise all land on its first date
+        valid = (values.notna().to_numpy() & ~np.isnat(published)
+                 & (position < len(dates)) & (published >= dates[0].to_datetime64()))
+
+        frame = pd.DataFrame({
+            'date': dates[position[valid]],
+            'ticker': news_df[ticker_col].to_numpy()[valid],
+            'value': values.to_numpy()[valid],
+        })
+        panel = frame.groupby(['date', 'ticker'])['value'].mean().unstack('ticker')
+        panel = panel.reindex(index=dates, columns=tickers).fillna(0.0)
+
+        logging.info("Sentiment panel built successfully.")
+        return panel
+
+    except Exception as e:
+        logging.error(f"Error building sentiment panel: {e}")
+        raise
+
+
+def _performance_stats(returns, positions, turnover):
+    """Summary statistics over the time axis (axis 1) of (combo, date) arrays."""
+    equity = np.cumprod(1.0 + returns, axis=1)
+    periods = returns.shape[1]
+
+    mean = returns.mean(axis=1)
+    std = returns.std(axis=1, ddof=1) if periods > 1 else np.zeros(len(returns))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpe = np.where(std > 0, mean / std * np.sqrt(TRADING_DAYS_PER_YEAR), np.nan)
+        drawdown = equity / np.maximum.accumulate(equity, axis=1) - 1.0
+        active = returns != 0
+        hit_rate = np.where(active.any(axis=1), (returns > 0).sum(axis=1) / active.sum(axis=1), np.nan)
+
+    total_return = equity[:, -1] - 1.0
+    return pd.DataFrame({
+        'total_return': total_return,
+        'annual_return': (1.0 + total_return) ** (TRADING_DAYS_PER_YEAR / periods) - 1.0,
+        'annual_volatility': std * np.sqrt(TRADING_DAYS_PER_YEAR),
+        'sharpe': sharpe,
+        'max_drawdown': drawdown.min(axis=1),
+        'hit_rate': hit_rate,
+        'avg_turnover': turnover.mean(axis=1),
+        'avg_exposure': positions.mean(axis=1),
+    }), equity
+
+
+def backtest_sentiment(close, sentiment, thresholds=(0.05,), holding_periods=(1,), sma_filter=(False,),
+                       rsi_bounds=(None,), cost_bps=5.0, long_short=True, sma=None, rsi=None):
+    """
+    Backtest sentiment signals over a date x ticker panel for a grid of parameters.
+
+    A ticker is bought when its daily sentiment exceeds the threshold (and sold short
+    when below minus the threshold if `long_short`). The position is entered at the
+    close of the signal date, which only includes news published before that close
+    (see `build_sentiment_panel`), and held for `holding_period` days, so it first
+    earns the next day's return. Overlapping signals each carry 1/holding_period of
+    the ticker's capital. Optional filters keep longs only above the 50-day SMA
+    (shorts below it) and skip longs when RSI is above the upper bound (shorts below
+    the lower bound). Transaction costs are charged on position changes.
+    The portfolio is equally weighted across tickers with a price on each day.
+
+    Every parameter combination is evaluated at once with array operations; memory use
+    is roughly combinations x dates x tickers floats.
+
+    Parameters:
+        close (pd.DataFrame): Closing prices, dates x tickers.
+        sentiment (pd.DataFrame): Daily sentiment, same shape as `close`.
+        thresholds (iterable): Absolute sentiment thresholds to sweep.
+        holding_periods (iterable): Holding periods in trading days to sweep.
+        sma_filter (iterable): Booleans; whether to apply the SMA trend filter.
+        rsi_bounds (iterable): None or (lower, upper) RSI bounds to sweep.
+        cost_bps (float): One-way transaction cost in basis points.
+        long_short (bool): Trade negative sentiment short as well as positive long.
+        sma (pd.DataFrame): 50-day SMA panel, required when `sma_filter` includes True.
+        rsi (pd.DataFrame): RSI panel, required when `rsi_bounds` includes bounds.
+
+    Returns:
+        tuple: (stats_df, equity_df)
+            - stats_df: One row per parameter combination with its performance statistics.
+            - equity_df: Equity curves, dates x combinations (columns match stats_df index).
+    """
+    try:
+        if not close.index.equals(sentiment.index) or not close.columns.equals(sentiment.columns):
+            raise ValueError("close and sentiment panels must share the same dates and tickers.")
+
+        thresholds = np.asarray(list(thresholds), dtype=float)
+        holding_periods = np.asarray(list(holding_periods), dtype=int)
+        sma_filter = list(sma_filter)
+        rsi_bounds = list(rsi_bounds)
+        if (holding_periods < 1).any():
+            raise ValueError("Holding periods must be at least 1 day.")
+        if any(sma_filter) and sma is None:
+            raise ValueError("An 'sma' panel is required to apply the SMA filter.")
+        if any(b is not None for b in rsi_bounds) and rsi is None:
+            raise ValueError("An 'rsi' panel is required to apply RSI bounds.")
+
+        prices = close.to_numpy(dtype=float)
+        n_dates = prices.shape[0]
+
+        # Daily asset returns; missing prices contribute no return
+        asset_returns = np.zeros_like(prices)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            asset_returns[1:] = prices[1:] / prices[:-1] - 1.0
+        tradable = np.isfinite(asset_returns) & np.isfinite(prices)
+        asset_returns = np.where(tradable, asset_returns, 0.0)
+
+        # Raw signals for every threshold: (thresholds, dates, tickers); no signal without a price
+        score = np.where(np.isfinite(prices), sentiment.to_numpy(dtype=float), 0.0)[None]
+        raw = (score > thresholds[:, None, None]).astype(float)
+        if long_short:
+            raw -= score < -thresholds[:, None, None]
+
+        # Filter masks for every (sma, rsi) variant: (filters, dates, tickers)
+        filters = list(itertools.product(sma_filter, rsi_bounds))
+        long_ok = np.ones((len(filters), *prices.shape), dtype=bool)
+        short_ok = np.ones_like(long_ok)
+        for i, (use_sma, bounds) in enumerate(filters):
+            if use_sma:
+                trend = prices - sma.reindex_like(close).to_numpy(dtype=float)
+                long_ok[i] &= trend > 0
+                short_ok[i] &= trend < 0
+            if bounds is not None:
+                rsi_values = rsi.reindex_like(close).to_numpy(dtype=float)
+                long_ok[i] &= ~(rsi_values > bounds[1])
+                short_ok[i] &= ~(rsi_values < bounds[0])
+
+        # Signals for (threshold, filter) pairs: (thresholds * filters, dates, tickers)
+        signals = np.where(raw[:, None] > 0, long_ok[None], np.where(raw[:, None] < 0, short_ok[None], False))
+        signals = (signals * raw[:, None]).reshape(-1, *prices.shape)
+
+        # Position at t averages the signals from t-h .. t-1, via prefix sums
+        prefix = np.concatenate([np.zeros((len(signals), 1, prices.shape[1])), np.cumsum(signals, axis=1)], axis=1)
+        lagged = np.clip(np.arange(n_dates)[None, :] - holding_periods[:, None], 0, None)
+        positions = (prefix[:, None, :n_dates] - prefix[:, lagged]) / holding_periods[None, :, None, None]
+        positions = positions.reshape(-1, *prices.shape)
+
+        # Net returns per ticker, then equally weighted across tradable tickers
+        trades = np.abs(np.diff(positions, axis=1, prepend=0.0))
+        ticker_returns = positions * asset_returns[None] - trades * cost_bps / 10_000
+        n_tradable = np.maximum(tradable.sum(axis=1), 1)
+        portfolio_returns = ticker_returns.sum(axis=2) / n_tradable
+        turnover = trades.sum(axis=2) / n_tradable
+        exposure = np.abs(positions).sum(axis=2) / n_tradable
+
+        stats, equity = _performance_stats(portfolio_returns, exposure, turnover)
+
+        grid = pd.DataFrame(
+            [(thr, use_sma, bounds, h)
+             for thr, (use_sma, bounds) in itertools.product(thresholds, filters)
+             for h in holding_periods],
+            columns=['threshold', 'sma_filter', 'rsi_bounds', 'holding_period'],
+        )
+        stats_df = pd.concat([grid, stats], axis=1)
+        equity_df = pd.DataFrame(equity.T, index=close.index, columns=stats_df.index)
+
+        logging.info(f"Backtest completed for {len(stats_df)} parameter combinations.")
+        return stats_df, equity_df
+
+    except Exception as e:
+        logging.error(f"Error in sentiment backtest: {e}")
+        raise
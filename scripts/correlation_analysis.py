@@ -1,6 +1,6 @@
-from textblob import TextBlob
 import pandas as pd
 import logging
+from scripts.sentiment_service import score_texts
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -54,15 +54,8 @@ def calculate_correlation(news_df, stock_df):
 
         logging.info("Data merged successfully.")
 
-        # Step 2: Sentiment Analysis on news headlines
-        def calculate_sentiment(text):
-            try:
-                return TextBlob(text).sentiment.polarity
-            except Exception as e:
-                logging.error(f"Error in sentiment analysis: {e}")
-                return None
-        
-        combined_df['sentiment'] = combined_df['headline'].apply(lambda x: calculate_sentiment(x))
+        # Step 2: Sentiment Analysis on news headlines (via the sentiment service if configured)
+        combined_df['sentiment'] = score_texts(combined_df['headline'].tolist(), model='textblob')
 
         # Drop rows with missing values
         combined_df.dropna(subset=['Close', 'sentiment'], inplace=True)
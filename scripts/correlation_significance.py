@@ -0,0 +1,175 @@
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Resamples evaluated per task; bounds memory at roughly chunk_size x n floats per array
+DEFAULT_CHUNK_SIZE = 500
+
+
+def _batched_pearson(x, y):
+    """Pearson r along axis 1 of two (resamples, n) arrays."""
+    dx = x - x.mean(axis=1, keepdims=True)
+    dy = y - y.mean(axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (dx * dy).sum(axis=1) / np.sqrt((dx * dx).sum(axis=1) * (dy * dy).sum(axis=1))
+
+
+def _bootstrap_indices(rng, n, block_size, n_resamples):
+    """Circular block bootstrap: each row concatenates random blocks of consecutive indices."""
+    n_blocks = -(-n // block_size)
+    starts = rng.integers(0, n, size=(n_resamples, n_blocks))
+    idx = (starts[:, :, None] + np.arange(block_size)) % n
+    return idx.reshape(n_resamples, -1)[:, :n]
+
+
+def _permutation_indices(rng, n, block_size, n_resamples):
+    """Block permutation: each row reorders the fixed blocks of consecutive indices."""
+    n_blocks = -(-n // block_size)
+    block_rank = np.argsort(rng.random((n_resamples, n_blocks)), axis=1)
+    position = np.arange(n)
+    # Sort positions by the new rank of their block, keeping order within each block
+    key = block_rank[:, position // block_size] * block_size + position % block_size
+    return np.argsort(key, axis=1, kind='stable')
+
+
+def _resample_chunk(x, y, block_size, n_resamples, seed):
+    """Bootstrap correlations and block-permutation correlations for one chunk of resamples."""
+    rng = np.random.default_rng(seed)
+    n = len(x)
+    boot = _bootstrap_indices(rng, n, block_size, n_resamples)
+    perm = _permutation_indices(rng, n, block_size, n_resamples)
+    return _batched_pearson(x[boot], y[boot]), _batched_pearson(x[None], y[perm])
+
+
+def default_block_size(n):
+    """Block length of roughly n^(1/3), a common choice for the block bootstrap."""
+    return max(1, int(round(n ** (1 / 3))))
+
+
+def _prepare(sentiment, returns):
+    x = np.asarray(sentiment, dtype=float)
+    y = np.asarray(returns, dtype=float)
+    if len(x) != len(y):
+        raise ValueError("Sentiment scores and returns must be of the same length.")
+    finite = np.isfinite(x) & np.isfinite(y)
+    return x[finite], y[finite]
+
+
+def _summarize(x, y, boot, perm, block_size, confidence):
+    r = _batched_pearson(x[None], y[None])[0]
+    alpha = 1 - confidence
+    boot = boot[np.isfinite(boot)]
+    perm = perm[np.isfinite(perm)]
+    return {
+        'n': len(x),
+        'r': r,
+        'ci_lower': np.quantile(boot, alpha / 2) if len(boot) else np.nan,
+        'ci_upper': np.quantile(boot, 1 - alpha / 2) if len(boot) else np.nan,
+        'p_value': (1 + np.sum(np.abs(perm) >= abs(r))) / (1 + len(perm)) if len(perm) and np.isfinite(r) else np.nan,
+        'block_size': block_size,
+        'n_resamples': len(boot),
+    }
+
+
+def correlation_significance_by_ticker(pairs, n_resamples=2000, block_size=None, confidence=0.95,
+                                       seed=0, n_workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Block-bootstrap confidence intervals and block-permutation p-values for
+    sentiment-return correlations of many tickers.
+
+    Resamples keep blocks of consecutive days together so autocorrelation in daily
+    data is preserved. Each task evaluates a chunk of resamples as index matrices in
+    batched NumPy operations; tasks run on a process pool. Every (ticker, chunk) task
+    gets its own seed spawned from `seed`, so results do not depend on `n_workers`.
+
+    Parameters:
+        pairs (dict): Mapping of ticker to a (sentiment, returns) pair of aligned sequences,
+            e.g. the first two outputs of `calculate_correlation`.
+        n_resamples (int): Number of bootstrap and permutation resamples per ticker.
+        block_size (int): Block length in observations; None uses about n^(1/3).
+        confidence (float): Confidence level of the bootstrap interval.
+        seed (int): Base seed for reproducible results.
+        n_workers (int): Worker processes; 1 runs in-process, None uses all CPUs.
+        chunk_size (int): Resamples evaluated per task.
+
+    Returns:
+        pd.DataFrame: One row per ticker with n, r, ci_lower, ci_upper, p_value,
+        block_size and n_resamples.
+    """
+    try:
+        if n_resamples < 1:
+            raise ValueError("n_resamples must be at least 1.")
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be between 0 and 1.")
+
+        tickers = sorted(pairs)
+        data, tasks = {}, []
+        ticker_seeds = np.random.SeedSequence(seed).spawn(len(tickers))
+        for ticker, ticker_seed in zip(tickers, ticker_seeds):
+            x, y = _prepare(*pairs[ticker])
+            size = block_size or default_block_size(len(x))
+            data[ticker] = (x, y, size)
+            if len(x) < 3:
+                logging.warning(f"Too few observations for '{ticker}' to test significance.")
+                continue
+            chunks = [min(chunk_size, n_resamples - start) for start in range(0, n_resamples, chunk_size)]
+            for chunk, chunk_seed in zip(chunks, ticker_seed.spawn(len(chunks))):
+                tasks.append((ticker, (x, y, size, chunk, chunk_seed)))
+
+        if n_workers == 1:
+            outputs = [_resample_chunk(*args) for _, args in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                outputs = list(executor.map(_resample_chunk, *zip(*(args for _, args in tasks)))) if tasks else []
+
+        boot = {ticker: [] for ticker in tickers}
+        perm = {ticker: [] for ticker in tickers}
+        for (ticker, _), (boot_r, perm_r) in zip(tasks, outputs):
+            boot[ticker].append(boot_r)
+            perm[ticker].append(perm_r)
+
+        rows = {}
+        for ticker in tickers:
+            x, y, size = data[ticker]
+            rows[ticker] = _summarize(x, y, np.concatenate(boot[ticker] or [np.empty(0)]),
+                                      np.concatenate(perm[ticker] or [np.empty(0)]), size, confidence)
+
+        results = pd.DataFrame.from_dict(rows, orient='index')
+        results.index.name = 'ticker'
+        logging.info(f"Correlation significance computed for {len(tickers)} ticker(s).")
+        return results
+
+    except Exception as e:
+        logging.error(f"Error in correlation significance testing: {e}")
+        raise
+
+
+def correlation_significance(sentiment, returns, n_resamples=2000, block_size=None, confidence=0.95,
+                             seed=0, n_workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Block-bootstrap confidence interval and block-permutation p-value for one
+    sentiment-return correlation.
+
+    Parameters:
+        sentiment (pd.Series or list): Sentiment scores.
+        returns (pd.Series or list): Corresponding daily stock returns.
+        n_resamples (int): Number of bootstrap and permutation resamples.
+        block_size (int): Block length in observations; None uses about n^(1/3).
+        confidence (float): Confidence level of the bootstrap interval.
+        seed (int): Seed for reproducible results.
+        n_workers (int): Worker processes; 1 runs in-process, None uses all CPUs.
+        chunk_size (int): Resamples evaluated per task.
+
+    Returns:
+        pd.Series: n, r, ci_lower, ci_upper, p_value, block_size and n_resamples.
+    """
+    results = correlation_significance_by_ticker(
+        {'series': (sentiment, returns)}, n_resamples=n_resamples, block_size=block_size,
+        confidence=confidence, seed=seed, n_workers=n_workers, chunk_size=chunk_size,
+    )
+    return results.loc['series'].rename(None)
@@ -1,6 +1,8 @@
 import pandas as pd
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from scripts.data_store import build_store, open_store, source_signature
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -71,3 +73,60 @@ def load_stock_data(file_path):
     df = load_csv_data(file_path, required_columns=['Date', 'Close'], date_column='Date')
     df.rename(columns={'Date': 'date'}, inplace=True)
     return df
+
+def load_stock_files(file_paths, max_workers=8):
+    """
+    Loads several per-ticker stock CSV files concurrently.
+
+    Parameters:
+        file_paths (dict): Mapping of ticker to the path of its stock data CSV file.
+        max_workers (int): Maximum number of files read at the same time.
+
+    Returns:
+        dict: Mapping of ticker to its stock DataFrame, as returned by `load_stock_data`.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        frames = list(executor.map(load_stock_data, file_paths.values()))
+    return dict(zip(file_paths, frames))
+
+def load_news_store(file_path, store_path=None, ticker_col='stock'):
+    """
+    Loads financial news into an indexed (ticker, date) store, building it on first use.
+
+    The store is rebuilt whenever the CSV changes; otherwise the existing memory-mapped
+    copy is opened without reading the CSV.
+
+    Parameters:
+        file_path (str): Path to the financial news CSV file.
+        store_path (str): Store directory; defaults to '<file_path>.store'.
+        ticker_col (str): Column holding the ticker symbol.
+
+    Returns:
+        TickerDateStore: Store of news rows sorted by ticker and date.
+    """
+    store_path = store_path or f"{file_path}.store"
+    sources = source_signature([file_path])
+    store = open_store(store_path, sources)
+    if store is None:
+        df = load_csv_data(file_path, required_columns=['date', 'headline', ticker_col])
+        store = build_store(df, store_path, ticker_col=ticker_col, date_col='date', sources=sources)
+    return store
+
+def load_stock_store(file_paths, store_path):
+    """
+    Loads per-ticker stock CSV files into one indexed (ticker, date) store.
+
+    Parameters:
+        file_paths (dict): Mapping of ticker to the path of its stock data CSV file.
+        store_path (str): Store directory.
+
+    Returns:
+        TickerDateStore: Store of price rows sorted by ticker and date.
+    """
+    sources = source_signature(file_paths.values())
+    store = open_store(store_path, sources)
+    if store is None:
+        frames = load_stock_files(file_paths)
+        df = pd.concat(frames, names=['ticker', None]).reset_index(level='ticker')
+        store = build_store(df, store_path, ticker_col='ticker', date_col='date', sources=sources)
+    return store
@@ -1,6 +1,8 @@
 import pandas as pd
 import os
+import glob
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -44,6 +46,65 @@ def load_stock_data(file_path):
         logging.error(f"Error loading file '{file_path}': {e}")
         raise
 
+def ticker_from_filename(file_path):
+    """
+    Derive the ticker symbol from a per-ticker file name, e.g. 'AAPL_historical_data.csv' -> 'AAPL'.
+
+    Parameters:
+        file_path (str): Path to a stock price CSV file.
+
+    Returns:
+        str: Ticker symbol.
+    """
+    return os.path.splitext(os.path.basename(file_path))[0].split('_')[0]
+
+def load_stock_directory(directory, pattern='*.csv', max_workers=8, ticker_parser=ticker_from_filename):
+    """
+    Load every per-ticker stock price CSV in a directory concurrently into one panel.
+
+    Files are read on a bounded thread pool with the same validation and date
+    normalisation as `load_stock_data`, then combined with a single concatenation.
+
+    Parameters:
+        directory (str): Directory containing one CSV file per ticker.
+        pattern (str): Glob pattern selecting the price files.
+        max_workers (int): Maximum number of files read at the same time.
+        ticker_parser (callable): Maps a file path to its ticker symbol.
+
+    Returns:
+        pd.DataFrame: Stock data indexed by ('ticker', 'Date').
+    """
+    if not os.path.isdir(directory):
+        logging.error(f"Directory not found: {directory}")
+        raise FileNotFoundError(f"Directory not found: {directory}")
+
+    try:
+        file_paths = sorted(glob.glob(os.path.join(directory, pattern)))
+        if not file_paths:
+            raise ValueError(f"No files matching '{pattern}' found in '{directory}'.")
+
+        tickers = [ticker_parser(path) for path in file_paths]
+        duplicates = {t for t in tickers if tickers.count(t) > 1}
+        if duplicates:
+            raise ValueError(f"Several files map to the same ticker(s): {duplicates}")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = list(executor.map(load_stock_data, file_paths))
+
+        frames = {ticker: df.set_index('Date') for ticker, df in zip(tickers, frames) if not df.empty}
+        if not frames:
+            logging.warning(f"All stock files in '{directory}' are empty.")
+            return pd.DataFrame()
+
+        panel = pd.concat(frames, names=['ticker', 'Date']).sort_index()
+
+        logging.info(f"Loaded {len(frames)} stock file(s) from '{directory}'.")
+        return panel
+
+    except Exception as e:
+        logging.error(f"Error loading stock directory '{directory}': {e}")
+        raise
+
 def prepare_stock_data(df):
     """
     Prepare and validate stock data for analysis.
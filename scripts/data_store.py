@@ -0,0 +1,259 @@
+import json
+import logging
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from scripts.market_time import EXCHANGE_TZ, to_exchange_time
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+META_FILE = 'meta.json'
+
+
+def _to_timestamp(value):
+    """Convert a query bound to the int64 exchange-time nanoseconds used by the store."""
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert(EXCHANGE_TZ).tz_localize(None)
+    return ts.as_unit('ns').value
+
+
+class TickerDateStore:
+    """
+    Read-only store of rows sorted by (ticker, timestamp).
+
+    Timestamps are stored as naive New York exchange time, so date bounds in queries
+    refer to US trading dates.
+
+    Each column lives in its own .npy file that is memory-mapped on open, so several
+    processes share one copy through the page cache. A per-ticker offset table gives
+    each ticker's row range, and date ranges within it are found by binary search,
+    so a query costs O(log N) and numeric columns are returned as views.
+    """
+
+    def __init__(self, path):
+        meta_path = os.path.join(path, META_FILE)
+        if not os.path.isfile(meta_path):
+            raise FileNotFoundError(f"No data store found at: {path}")
+
+        with open(meta_path) as f:
+            self.meta = json.load(f)
+
+        self.path = path
+        self.tickers = self.meta['tickers']
+        self.offsets = np.asarray(self.meta['offsets'], dtype=np.int64)
+        self._ticker_pos = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self._dates = self._load('__date__')
+        self._columns = {}
+
+    def __len__(self):
+        return int(self.offsets[-1])
+
+    @property
+    def columns(self):
+        return list(self.meta['columns'])
+
+    def _load(self, name):
+        return np.load(os.path.join(self.path, f'{name}.npy'), mmap_mode='r')
+
+    def _column(self, name):
+        if name not in self._columns:
+            kind = self.meta['columns'][name]
+            if kind == 'string':
+                self._columns[name] = (self._load(f'{name}.data'), self._load(f'{name}.offsets'),
+                                       self._load(f'{name}.null'))
+            else:
+                self._columns[name] = self._load(name)
+        return self._columns[name]
+
+    def locate(self, ticker, start=None, end=None):
+        """
+        Row range of a ticker between two dates.
+
+        Parameters:
+            ticker (str): Ticker symbol.
+            start (str or datetime): Inclusive lower bound; None for the first row.
+            end (str or datetime): Inclusive upper bound; None for the last row. A
+                date-only bound (midnight, e.g. '2020-06-05') includes that whole day.
+
+        Returns:
+            tuple: (lo, hi) row positions; rows lo..hi-1 match.
+        """
+        if ticker not in self._ticker_pos:
+            raise KeyError(f"Ticker '{ticker}' not found in the data store.")
+
+        i = self._ticker_pos[ticker]
+        first, last = int(self.offsets[i]), int(self.offsets[i + 1])
+        dates = self._dates[first:last]
+        lo = first + int(np.searchsorted(dates, _to_timestamp(start), side='left')) if start is not None else first
+        if end is None:
+            hi = last
+        else:
+            end_ts = pd.Timestamp(_to_timestamp(end))
+            if end_ts == end_ts.normalize():
+                # Date-only bound: include every row on that day
+                hi = first + int(np.searchsorted(dates, (end_ts + pd.Timedelta(days=1)).value, side='left'))
+            else:
+                hi = first + int(np.searchsorted(dates, end_ts.value, side='right'))
+        return lo, hi
+
+    def arrays(self, ticker, start=None, end=None, columns=None):
+        """
+        Column arrays for a ticker and date range.
+
+        Numeric and date columns are zero-copy views into the memory map; string
+        columns are decoded for the selected rows only.
+
+        Parameters:
+            ticker (str): Ticker symbol.
+            start (str or datetime): Inclusive lower date bound.
+            end (str or datetime): Inclusive upper date bound; a date-only bound includes that day.
+            columns (list): Columns to return; None returns all of them.
+
+        Returns:
+            dict: Column name to array, including the date column.
+        """
+        lo, hi = self.locate(ticker, start, end)
+        result = {self.meta['date_col']: self._dates[lo:hi].view('datetime64[ns]')}
+        for name in columns if columns is not None else self.columns:
+            if name not in self.meta['columns']:
+                raise KeyError(f"Column '{name}' not found in the data store.")
+            column = self._column(name)
+            if self.meta['columns'][name] == 'string':
+                data, offsets, null = column
+                bounds = offsets[lo:hi + 1]
+                raw = bytes(data[bounds[0]:bounds[-1]])
+                starts = bounds - bounds[0]
+                result[name] = np.array(
+                    [None if null[lo + k] else raw[starts[k]:starts[k + 1]].decode('utf-8')
+                     for k in range(hi - lo)],
+                    dtype=object,
+                )
+            else:
+                result[name] = column[lo:hi]
+        return result
+
+    def frame(self, ticker, start=None, end=None, columns=None):
+        """
+        DataFrame for a ticker and date range, with the date column as the index.
+
+        Unlike `arrays`, this copies the selected rows out of the memory map.
+        """
+        arrays = self.arrays(ticker, start, end, columns)
+        date_col = self.meta['date_col']
+        index = pd.DatetimeIndex(arrays.pop(date_col), name=date_col)
+        df = pd.DataFrame(arrays, index=index)
+        df.insert(0, self.meta['ticker_col'], ticker)
+        return df
+
+
+def build_store(df, path, ticker_col, date_col, sources=None):
+    """
+    Sort rows by (ticker, date) and write them as a memory-mappable store.
+
+    Parameters:
+        df (pd.DataFrame): Data with ticker and date columns.
+        path (str): Directory to write; replaced if it already exists.
+        ticker_col (str): Column holding ticker symbols.
+        date_col (str): Column holding dates; rows with invalid dates are dropped. Dates
+            are converted to New York exchange time (naive dates are taken as-is).
+        sources (dict): Optional metadata about the source files, used to detect staleness.
+
+    Returns:
+        TickerDateStore: The newly written store, opened read-only.
+    """
+    try:
+        missing = {ticker_col, date_col} - set(df.columns)
+        if missing:
+            raise ValueError(f"Missing required column(s): {missing}")
+
+        dates = to_exchange_time(df[date_col])
+        valid = dates.notna().to_numpy() & df[ticker_col].notna().to_numpy()
+        if not valid.all():
+            logging.warning(f"{(~valid).sum()} row(s) with missing ticker or invalid date dropped from the store.")
+
+        tickers, codes = np.unique(df[ticker_col].to_numpy()[valid].astype(str), return_inverse=True)
+        date_values = dates.to_numpy()[valid].view(np.int64)
+
+        # One lexsort orders rows by ticker, then date
+        order = np.lexsort((date_values, codes))
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=len(tickers)))])
+
+        tmp_path = f'{path}.tmp'
+        if os.path.exists(tmp_path):
+            shutil.rmtree(tmp_path)
+        os.makedirs(tmp_path)
+
+        np.save(os.path.join(tmp_path, '__date__.npy'), date_values[order])
+
+        kinds = {}
+        for name in df.columns:
+            if name in (ticker_col, date_col):
+                continue
+            values = df[name].to_numpy()[valid][order]
+            if pd.api.types.is_datetime64_any_dtype(df[name]):
+                kinds[name] = 'datetime'
+                np.save(os.path.join(tmp_path, f'{name}.npy'), to_exchange_time(values).to_numpy())
+            elif pd.api.types.is_numeric_dtype(df[name]) or pd.api.types.is_bool_dtype(df[name]):
+                kinds[name] = 'numeric'
+                np.save(os.path.join(tmp_path, f'{name}.npy'), values)
+            else:
+                # Variable-length strings: one UTF-8 blob plus row offsets and a null mask
+                kinds[name] = 'string'
+                null = pd.isna(values)
+                encoded = [b'' if is_null else str(v).encode('utf-8') for v, is_null in zip(values, null)]
+                lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=len(encoded))
+                np.save(os.path.join(tmp_path, f'{name}.data.npy'), np.frombuffer(b''.join(encoded), dtype=np.uint8))
+                np.save(os.path.join(tmp_path, f'{name}.offsets.npy'), np.concatenate([[0], np.cumsum(lengths)]))
+                np.save(os.path.join(tmp_path, f'{name}.null.npy'), null)
+
+        meta = {
+            'ticker_col': ticker_col,
+            'date_col': date_col,
+            'tickers': tickers.tolist(),
+            'offsets': offsets.tolist(),
+            'columns': kinds,
+            'sources': sources or {},
+        }
+        with open(os.path.join(tmp_path, META_FILE), 'w') as f:
+            json.dump(meta, f)
+
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        os.rename(tmp_path, path)
+
+        logging.info(f"Data store with {len(order)} rows and {len(tickers)} tickers written to '{path}'.")
+        return TickerDateStore(path)
+
+    except Exception as e:
+        logging.error(f"Error building data store at '{path}': {e}")
+        raise
+
+
+def source_signature(file_paths):
+    """Size and modification time of each source file, used to detect stale stores."""
+    return {str(p): [os.path.getsize(p), os.path.getmtime(p)] for p in file_paths}
+
+
+def open_store(path, sources=None):
+    """
+    Open a store if it exists and was built from the given sources.
+
+    Parameters:
+        path (str): Store directory.
+        sources (dict): Expected source signature; None skips the staleness check.
+
+    Returns:
+        TickerDateStore or None: The store, or None if it is missing or stale.
+    """
+    if not os.path.isfile(os.path.join(path, META_FILE)):
+        return None
+    store = TickerDateStore(path)
+    if sources is not None and store.meta.get('sources') != json.loads(json.dumps(sources)):
+        logging.info(f"Data store at '{path}' is stale and will be rebuilt.")
+        return None
+    return store
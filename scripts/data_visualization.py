@@ -1,6 +1,7 @@
 import matplotlib.pyplot as plt
 import seaborn as sns
 import logging
+from scripts.downsampling import DEFAULT_MAX_POINTS, downsample_indices
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -43,12 +44,23 @@ def calculate_technical_indicators(df):
         raise
 
 
-def plot_stock_data(df):
+def _plot_series(x, y, max_points, method, **kwargs):
+    """Plot a series after reducing it to at most `max_points` shape-preserving points."""
+    idx = downsample_indices(x, y, max_points=max_points, method=method)
+    plt.plot(x[idx], y[idx], **kwargs)
+
+
+def plot_stock_data(df, max_points=DEFAULT_MAX_POINTS, method='minmax'):
     """
     Plot stock closing prices with Simple Moving Averages (SMA).
 
+    Long series are downsampled before plotting so rendering time depends on the
+    figure width rather than the number of bars.
+
     Parameters:
         df (pd.DataFrame): Input DataFrame containing 'Close', 'SMA_50', and 'SMA_200' columns.
+        max_points (int): Maximum points drawn per line; None draws every point.
+        method (str): Downsampling method, 'minmax' or 'lttb'.
     """
     try:
         if not {'Close', 'SMA_50', 'SMA_200'}.issubset(df.columns):
@@ -57,9 +69,13 @@ def plot_stock_data(df):
         plt.figure(figsize=(14, 7))
         sns.set_style("whitegrid")
 
-        plt.plot(df.index, df['Close'], label='Close Price', color='blue', linewidth=1.5)
-        plt.plot(df.index, df['SMA_50'], label='50-Day SMA', color='orange', linestyle='--', linewidth=1.5)
-        plt.plot(df.index, df['SMA_200'], label='200-Day SMA', color='green', linestyle='--', linewidth=1.5)
+        x = df.index.to_numpy()
+        _plot_series(x, df['Close'].to_numpy(), max_points, method,
+                     label='Close Price', color='blue', linewidth=1.5)
+        _plot_series(x, df['SMA_50'].to_numpy(), max_points, method,
+                     label='50-Day SMA', color='orange', linestyle='--', linewidth=1.5)
+        _plot_series(x, df['SMA_200'].to_numpy(), max_points, method,
+                     label='200-Day SMA', color='green', linestyle='--', linewidth=1.5)
 
         plt.title('Stock Price with SMA Indicators', fontsize=14)
         plt.xlabel('Date', fontsize=12)
@@ -73,12 +89,14 @@ def plot_stock_data(df):
         raise
 
 
-def plot_rsi(df):
+def plot_rsi(df, max_points=DEFAULT_MAX_POINTS, method='minmax'):
     """
     Plot Relative Strength Index (RSI) with overbought and oversold levels.
 
     Parameters:
         df (pd.DataFrame): Input DataFrame containing 'RSI' column.
+        max_points (int): Maximum points drawn; None draws every point.
+        method (str): Downsampling method, 'minmax' or 'lttb'.
     """
     try:
         if 'RSI' not in df.columns:
@@ -87,7 +105,8 @@ def plot_rsi(df):
         plt.figure(figsize=(14, 5))
         sns.set_style("whitegrid")
 
-        plt.plot(df.index, df['RSI'], label='RSI', color='purple', linewidth=1.5)
+        _plot_series(df.index.to_numpy(), df['RSI'].to_numpy(), max_points, method,
+                     label='RSI', color='purple', linewidth=1.5)
         plt.axhline(70, color='red', linestyle='--', linewidth=1, label='Overbought (70)')
         plt.axhline(30, color='green', linestyle='--', linewidth=1, label='Oversold (30)')
 
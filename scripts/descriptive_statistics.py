@@ -7,51 +7,64 @@ import logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 
-def basic_statistics(df, column):
+def basic_statistics(df, column, stats=None):
     """
     Calculate basic statistics for a text column.
 
     Parameters:
-        df (pd.DataFrame): Input DataFrame.
+        df (pd.DataFrame): Input DataFrame (left unmodified).
         column (str): The column name containing text data.
+        stats (NewsStatistics): Optional running statistics for `column`; when given,
+            results are read from it instead of rescanning `df`.
 
     Returns:
         pd.Series: Basic descriptive statistics of text lengths.
     """
     try:
+        if stats is not None:
+            if stats.text_col != column:
+                raise ValueError(f"Statistics were built for column '{stats.text_col}', not '{column}'.")
+            logging.info("Basic text statistics read from running statistics.")
+            return stats.describe_lengths()
+
         if column not in df.columns:
             raise ValueError(f"Column '{column}' not found in the DataFrame.")
-        
+
         # Ensure text column has valid string values
-        df[column] = df[column].fillna("").astype(str)
-        df['text_length'] = df[column].apply(len)
+        text_length = df[column].fillna("").astype(str).str.len().rename('text_length')
 
-        stats = df['text_length'].describe()
+        summary = text_length.describe()
         logging.info("Basic text statistics calculated successfully.")
-        return stats
+        return summary
 
     except Exception as e:
         logging.error(f"Error in calculating basic statistics: {e}")
         raise
 
 
-def articles_per_publisher(df, publisher_col):
+def articles_per_publisher(df, publisher_col, stats=None):
     """
     Count the number of articles per publisher and display the top 10.
 
     Parameters:
         df (pd.DataFrame): Input DataFrame.
         publisher_col (str): Column name containing publisher names.
+        stats (NewsStatistics): Optional running statistics for `publisher_col`; when
+            given, counts are read from it instead of rescanning `df`.
 
     Returns:
         pd.Series: Top 10 publishers by article count.
     """
     try:
-        if publisher_col not in df.columns:
-            raise ValueError(f"Column '{publisher_col}' not found in the DataFrame.")
-
         # Calculate publisher counts
-        publisher_counts = df[publisher_col].value_counts().nlargest(10)
+        if stats is not None:
+            if stats.publisher_col != publisher_col:
+                raise ValueError(f"Statistics were built for column '{stats.publisher_col}', not '{publisher_col}'.")
+            publisher_counts = stats.top_publishers(10)
+        elif publisher_col not in df.columns:
+            raise ValueError(f"Column '{publisher_col}' not found in the DataFrame.")
+        else:
+            publisher_counts = df[publisher_col].value_counts().nlargest(10)
 
         # Plot the results
         plt.figure(figsize=(12, 8))
@@ -71,31 +84,40 @@ def articles_per_publisher(df, publisher_col):
         raise
 
 
-def publication_trends(df, date_col):
+def publication_trends(df, date_col, stats=None):
     """
     Analyze publication trends over time.
 
     Parameters:
         df (pd.DataFrame): Input DataFrame.
         date_col (str): Column name containing publication dates.
+        stats (NewsStatistics): Optional running statistics for `date_col`; when given,
+            monthly counts are read from it instead of rescanning `df`.
 
     Returns:
         pd.Series: Number of articles published per month.
     """
     try:
-        if date_col not in df.columns:
-            raise ValueError(f"Column '{date_col}' not found in the DataFrame.")
-
-        # Convert dates to datetime
-        df[date_col] = pd.to_datetime(df[date_col], errors='coerce')
-        if df[date_col].isna().all():
-            raise ValueError("All date values are invalid or missing after conversion.")
-
-        # Extract year and month
-        df['year_month'] = df[date_col].dt.to_period('M')
-
-        # Group by year and month
-        trends = df.groupby('year_month').size()
+        if stats is not None:
+            if stats.date_col != date_col:
+                raise ValueError(f"Statistics were built for column '{stats.date_col}', not '{date_col}'.")
+            trends = stats.monthly_trends()
+            if trends.empty:
+                raise ValueError("The running statistics contain no valid dates.")
+        else:
+            if date_col not in df.columns:
+                raise ValueError(f"Column '{date_col}' not found in the DataFrame.")
+
+            # Convert dates to datetime
+            df[date_col] = pd.to_datetime(df[date_col], errors='coerce')
+            if df[date_col].isna().all():
+                raise ValueError("All date values are invalid or missing after conversion.")
+
+            # Extract year and month
+            df['year_month'] = df[date_col].dt.to_period('M')
+
+            # Group by year and month
+            trends = df.groupby('year_month').size()
 
         # Plot the trends
         plt.figure(figsize=(12, 6))
@@ -0,0 +1,151 @@
+import numpy as np
+import pandas as pd
+
+# Default number of points kept per plotted series; about two per pixel of a 14-inch figure
+DEFAULT_MAX_POINTS = 2800
+
+
+def _as_numeric(x):
+    """Return x as a float array, converting datetimes (tz-aware or not) to epoch nanoseconds."""
+    if isinstance(x, pd.DatetimeIndex) or pd.api.types.is_datetime64_any_dtype(x) or np.asarray(x).dtype == object:
+        index = pd.DatetimeIndex(x)
+        values = index.as_unit('ns').asi8.astype(float)
+        values[index.isna()] = np.nan
+        return values
+    return np.asarray(x, dtype=float)
+
+
+def _bucket_edges(n_points, n_buckets):
+    """Start offsets of `n_buckets` contiguous, near-equal buckets over `n_points` points."""
+    return np.linspace(0, n_points, n_buckets + 1).astype(int)
+
+
+def minmax_indices(y, n_out):
+    """
+    Select the minimum and maximum point of each bucket, keeping the first and last points.
+
+    Spikes survive downsampling because every bucket keeps both its extremes. All
+    buckets are reduced at once with two sorts, so the cost is O(N log N).
+
+    Parameters:
+        y (array-like): Series values.
+        n_out (int): Approximate number of points to keep.
+
+    Returns:
+        np.ndarray: Sorted indices of the points to plot.
+    """
+    y = np.asarray(y, dtype=float)
+    n_points = len(y)
+    if n_out >= n_points or n_points <= 2:
+        return np.arange(n_points)
+
+    n_buckets = max(n_out // 2, 1)
+    edges = _bucket_edges(n_points, n_buckets)
+    bucket = np.repeat(np.arange(n_buckets), np.diff(edges))
+
+    # Within each bucket, sorting by value puts the minimum first and the maximum last
+    order_min = np.lexsort((np.where(np.isnan(y), np.inf, y), bucket))
+    order_max = np.lexsort((np.where(np.isnan(y), -np.inf, y), bucket))
+    keep = np.concatenate([order_min[edges[:-1]], order_max[edges[1:] - 1], [0, n_points - 1]])
+    return np.unique(keep)
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Select points with the Largest-Triangle-Three-Buckets algorithm.
+
+    LTTB keeps, from each bucket, the point forming the largest triangle with the point
+    kept from the previous bucket and the mean of the next bucket, which preserves the
+    visual shape of the series. NaN values are skipped.
+
+    Parameters:
+        x (array-like): X values (numeric or datetime).
+        y (array-like): Series values.
+        n_out (int): Number of points to keep (at least 3).
+
+    Returns:
+        np.ndarray: Sorted indices of the points to plot.
+    """
+    x = _as_numeric(x)
+    y = np.asarray(y, dtype=float)
+    finite = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    n_points = len(finite)
+    if n_out >= n_points or n_out < 3:
+        return finite
+
+    xs, ys = x[finite], y[finite]
+    edges = _bucket_edges(n_points - 2, n_out - 2) + 1
+
+    # Mean of every bucket, computed in one pass; the last point acts as the final "next bucket"
+    counts = np.diff(edges)
+    mean_x = np.append(np.add.reduceat(xs[1:-1], edges[:-1] - 1) / counts, xs[-1])
+    mean_y = np.append(np.add.reduceat(ys[1:-1], edges[:-1] - 1) / counts, ys[-1])
+
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n_points - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        area = np.abs(
+            (xs[previous] - mean_x[i + 1]) * (ys[start:stop] - ys[previous])
+            - (xs[previous] - xs[start:stop]) * (mean_y[i + 1] - ys[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[i + 1] = previous
+
+    return finite[selected]
+
+
+def downsample_indices(x, y, max_points=DEFAULT_MAX_POINTS, method='minmax'):
+    """
+    Choose which points of a series to plot.
+
+    Parameters:
+        x (array-like): X values (numeric or datetime).
+        y (array-like): Series values.
+        max_points (int): Maximum number of points to keep; None keeps all of them.
+        method (str): 'minmax' (extremes per bucket) or 'lttb'.
+
+    Returns:
+        np.ndarray: Sorted indices of the points to plot.
+    """
+    n_points = len(y)
+    if max_points is None or n_points <= max_points:
+        return np.arange(n_points)
+    if method == 'minmax':
+        return minmax_indices(y, max_points)
+    if method == 'lttb':
+        return lttb_indices(x, y, max_points)
+    raise ValueError(f"Unknown downsampling method '{method}'. Expected 'minmax' or 'lttb'.")
+
+
+def linear_fit(x, y):
+    """
+    Least-squares line and Pearson correlation from vectorized sums.
+
+    Parameters:
+        x (array-like): Independent values.
+        y (array-like): Dependent values.
+
+    Returns:
+        tuple: (slope, intercept, r, n) over the pairs where both values are finite.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    finite = np.isfinite(x) & np.isfinite(y)
+    x, y = x[finite], y[finite]
+    n = len(x)
+    if n < 2:
+        return np.nan, np.nan, np.nan, n
+
+    # Centre first so the sums stay numerically stable
+    dx = x - x.mean()
+    dy = y - y.mean()
+    sxx, syy, sxy = dx @ dx, dy @ dy, dx @ dy
+    if sxx == 0:
+        return np.nan, np.nan, np.nan, n
+
+    slope = sxy / sxx
+    intercept = y.mean() - slope * x.mean()
+    r = sxy / np.sqrt(sxx * syy) if syy > 0 else np.nan
+    return slope, intercept, r, n
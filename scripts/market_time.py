@@ -0,0 +1,53 @@
+import datetime
+
+import pandas as pd
+
+# Exchange the price data comes from; timestamps are compared in its local time
+EXCHANGE_TZ = 'America/New_York'
+MARKET_CLOSE = datetime.time(16, 0)
+
+
+def to_exchange_time(values):
+    """
+    Convert date/time values to tz-naive exchange-local (New York) timestamps.
+
+    Values with a UTC offset or timezone, including mixed offsets across daylight
+    saving changes, are converted to New York time. Naive values are assumed to be
+    in exchange time already. Unparseable values become NaT.
+
+    Parameters:
+        values (array-like): Dates as strings, datetimes or timestamps.
+
+    Returns:
+        pd.Series: datetime64[ns] values in New York local time.
+    """
+    values = pd.Series(values)
+    try:
+        converted = pd.to_datetime(values, errors='coerce', format='mixed')
+    except ValueError:
+        # Mixed UTC offsets cannot share one timezone; normalise through UTC
+        converted = pd.to_datetime(values, errors='coerce', utc=True, format='mixed')
+    if not pd.api.types.is_datetime64_any_dtype(converted):
+        converted = pd.to_datetime(values, errors='coerce', utc=True, format='mixed')
+    if converted.dt.tz is not None:
+        converted = converted.dt.tz_convert(EXCHANGE_TZ).dt.tz_localize(None)
+    return converted.astype('datetime64[ns]')
+
+
+def session_dates(values):
+    """
+    Calendar date of the first trading session that can react to each timestamp.
+
+    Anything published at or after the 16:00 close belongs to the next day's
+    session. Date-only values (midnight) are assumed to be published before the close.
+
+    Parameters:
+        values (array-like): Publication dates or timestamps.
+
+    Returns:
+        pd.Series: Normalised datetime64[ns] dates in exchange time.
+    """
+    local = to_exchange_time(values)
+    day = local.dt.normalize()
+    after_close = (local - day) >= pd.Timedelta(hours=MARKET_CLOSE.hour, minutes=MARKET_CLOSE.minute)
+    return day + pd.to_timedelta(after_close.astype(int), unit='D')
@@ -0,0 +1,309 @@
+import json
+import logging
+import os
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from scripts.market_time import to_exchange_time
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+class RunningMoments:
+    """
+    Count, mean, variance, min and max maintained with Welford/Chan updates.
+
+    Batches are folded in with the parallel form of Welford's algorithm, so updating
+    costs O(batch) and two instances can be merged exactly.
+    """
+
+    def __init__(self, count=0, mean=0.0, m2=0.0, minimum=np.inf, maximum=-np.inf):
+        self.count = int(count)
+        self.mean = float(mean)
+        self.m2 = float(m2)
+        self.minimum = float(minimum)
+        self.maximum = float(maximum)
+
+    def update(self, values):
+        """Fold an array of new values into the running moments."""
+        values = np.asarray(values, dtype=float)
+        values = values[np.isfinite(values)]
+        if len(values):
+            batch_mean = values.mean()
+            self.merge(RunningMoments(len(values), batch_mean, ((values - batch_mean) ** 2).sum(),
+                                      values.min(), values.max()))
+        return self
+
+    def merge(self, other):
+        """Merge another RunningMoments into this one."""
+        if other.count == 0:
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / total
+        self.count = total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    @property
+    def variance(self):
+        """Sample variance (ddof=1), matching pandas."""
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+    def to_dict(self):
+        return {'count': self.count, 'mean': self.mean, 'm2': self.m2,
+                'minimum': self.minimum, 'maximum': self.maximum}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+
+class TDigest:
+    """
+    Merging t-digest for approximate quantiles.
+
+    Values are kept as weighted centroids that are small near the tails and larger
+    in the middle (k1 scale function), so extreme quantiles stay accurate while the
+    digest holds roughly `compression` centroids regardless of how much data it has seen.
+    """
+
+    def __init__(self, compression=200, means=None, weights=None):
+        self.compression = compression
+        self.means = np.asarray(means if means is not None else [], dtype=float)
+        self.weights = np.asarray(weights if weights is not None else [], dtype=float)
+
+    @property
+    def count(self):
+        return float(self.weights.sum())
+
+    def update(self, values):
+        """Add an array of new values."""
+        values = np.asarray(values, dtype=float)
+        values = values[np.isfinite(values)]
+        if len(values):
+            self._compress(np.concatenate([self.means, values]),
+                           np.concatenate([self.weights, np.ones(len(values))]))
+        return self
+
+    def merge(self, other):
+        """Merge another TDigest into this one."""
+        if len(other.means):
+            self._compress(np.concatenate([self.means, other.means]),
+                           np.concatenate([self.weights, other.weights]))
+        return self
+
+    def _compress(self, means, weights):
+        # Sort all centroids, then group neighbours that share one unit of the k1 scale
+        order = np.argsort(means, kind='mergesort')
+        means, weights = means[order], weights[order]
+        cumulative = np.cumsum(weights)
+        q_mid = (cumulative - weights / 2) / cumulative[-1]
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * q_mid - 1)
+        group = np.floor(k)
+        # Keep the extreme values as singleton centroids so min/max stay exact
+        group[0], group[-1] = -np.inf, np.inf
+        starts = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+
+        merged_weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / merged_weights
+        self.weights = merged_weights
+
+    def quantile(self, q):
+        """
+        Estimate one or more quantiles.
+
+        Parameters:
+            q (float or array-like): Quantiles in [0, 1].
+
+        Returns:
+            float or np.ndarray: Estimated values (NaN if the digest is empty).
+        """
+        q = np.asarray(q, dtype=float)
+        if not len(self.means):
+            return np.full(q.shape, np.nan) if q.ndim else np.nan
+        if len(self.means) == 1:
+            return np.full(q.shape, self.means[0]) if q.ndim else float(self.means[0])
+
+        # Interpolate between centroid centres placed at their mean rank, scaled like
+        # pandas' linear quantiles (rank / (N - 1)); exact when every centroid is one value
+        cumulative = np.cumsum(self.weights)
+        positions = (cumulative - self.weights / 2 - 0.5) / (cumulative[-1] - 1)
+        result = np.interp(q, positions, self.means)
+        return result if q.ndim else float(result)
+
+    def to_dict(self):
+        return {'compression': self.compression, 'means': self.means.tolist(),
+                'weights': self.weights.tolist()}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+
+class NewsStatistics:
+    """
+    Mergeable summary of a news dataset that can be updated with appended rows.
+
+    Holds running moments and a t-digest of headline lengths, article counts per
+    publisher and per month, and the number of rows already folded in, so appending
+    news only requires scanning the new rows.
+    """
+
+    def __init__(self, text_col='headline', publisher_col='publisher', date_col='date'):
+        self.text_col = text_col
+        self.publisher_col = publisher_col
+        self.date_col = date_col
+        self.rows_seen = 0
+        self.length_moments = RunningMoments()
+        self.length_digest = TDigest()
+        self.publisher_counts = Counter()
+        self.monthly_counts = Counter()
+
+    def update(self, df):
+        """
+        Fold new rows into the statistics.
+
+        Parameters:
+            df (pd.DataFrame): Rows not yet included in the statistics.
+
+        Returns:
+            NewsStatistics: self, for chaining.
+        """
+        if self.text_col in df.columns:
+            lengths = df[self.text_col].fillna("").astype(str).str.len().to_numpy()
+            self.length_moments.update(lengths)
+            self.length_digest.update(lengths)
+
+        if self.publisher_col in df.columns:
+            self.publisher_counts.update(df[self.publisher_col].value_counts().to_dict())
+
+        if self.date_col in df.columns:
+            # Exchange-local time handles mixed -04:00/-05:00 offsets and keeps US month boundaries
+            months = to_exchange_time(df[self.date_col]).dt.to_period('M').dropna()
+            self.monthly_counts.update(months.astype(str).value_counts().to_dict())
+
+        self.rows_seen += len(df)
+        return self
+
+    def update_appended(self, df):
+        """
+        Fold in only the rows appended since the last update.
+
+        Assumes `df` is the full, append-only dataset; rows before `rows_seen` are skipped.
+        """
+        if len(df) < self.rows_seen:
+            raise ValueError(f"DataFrame has {len(df)} rows but statistics already cover {self.rows_seen}.")
+        return self.update(df.iloc[self.rows_seen:])
+
+    def merge(self, other):
+        """Merge statistics computed over a disjoint set of rows."""
+        self.rows_seen += other.rows_seen
+        self.length_moments.merge(other.length_moments)
+        self.length_digest.merge(other.length_digest)
+        self.publisher_counts.update(other.publisher_counts)
+        self.monthly_counts.update(other.monthly_counts)
+        return self
+
+    def describe_lengths(self):
+        """
+        Headline length statistics in the layout of `pd.Series.describe()`.
+
+        Quantiles are t-digest estimates; count, mean, std, min and max are exact.
+        """
+        moments = self.length_moments
+        quartiles = self.length_digest.quantile([0.25, 0.5, 0.75])
+        if not moments.count:
+            quartiles = [np.nan] * 3
+        return pd.Series(
+            [moments.count, moments.mean if moments.count else np.nan, moments.std,
+             moments.minimum if moments.count else np.nan, *quartiles,
+             moments.maximum if moments.count else np.nan],
+            index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'],
+            name='text_length',
+        )
+
+    def top_publishers(self, n=10):
+        """Article counts of the `n` most frequent publishers."""
+        return pd.Series(dict(self.publisher_counts.most_common(n)), name='count', dtype='int64')
+
+    def monthly_trends(self):
+        """Articles per month as a Series indexed by monthly Period."""
+        trends = pd.Series(self.monthly_counts, dtype='int64')
+        trends.index = pd.PeriodIndex(trends.index, freq='M')
+        trends.index.name = 'year_month'
+        return trends.sort_index()
+
+    def to_dict(self):
+        return {
+            'text_col': self.text_col,
+            'publisher_col': self.publisher_col,
+            'date_col': self.date_col,
+            'rows_seen': self.rows_seen,
+            'length_moments': self.length_moments.to_dict(),
+            'length_digest': self.length_digest.to_dict(),
+            'publisher_counts': dict(self.publisher_counts),
+            'monthly_counts': dict(self.monthly_counts),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls(data['text_col'], data['publisher_col'], data['date_col'])
+        stats.rows_seen = data['rows_seen']
+        stats.length_moments = RunningMoments.from_dict(data['length_moments'])
+        stats.length_digest = TDigest.from_dict(data['length_digest'])
+        stats.publisher_counts = Counter(data['publisher_counts'])
+        stats.monthly_counts = Counter(data['monthly_counts'])
+        return stats
+
+    def save(self, path):
+        """Write the statistics to a JSON file."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        """Read statistics previously written with `save`."""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+def update_news_statistics(df, stats_path, text_col='headline', publisher_col='publisher', date_col='date'):
+    """
+    Load persisted statistics, fold in rows appended since they were saved, and save them.
+
+    Parameters:
+        df (pd.DataFrame): Full, append-only news dataset.
+        stats_path (str): JSON file holding the statistics (created if missing).
+        text_col (str): Column containing headline text.
+        publisher_col (str): Column containing publisher names.
+        date_col (str): Column containing publication dates.
+
+    Returns:
+        NewsStatistics: Statistics covering every row of `df`.
+    """
+    try:
+        if os.path.isfile(stats_path):
+            stats = NewsStatistics.load(stats_path)
+        else:
+            stats = NewsStatistics(text_col, publisher_col, date_col)
+
+        new_rows = len(df) - stats.rows_seen
+        stats.update_appended(df)
+        stats.save(stats_path)
+
+        logging.info(f"News statistics updated with {new_rows} new row(s).")
+        return stats
+
+    except Exception as e:
+        logging.error(f"Error updating news statistics: {e}")
+        raise
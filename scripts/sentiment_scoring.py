@@ -0,0 +1,57 @@
+from functools import lru_cache
+from nltk.sentiment import SentimentIntensityAnalyzer
+from textblob import TextBlob
+import pandas as pd
+import logging
+import nltk
+
+SENTIMENT_MODELS = ('vader', 'textblob')
+
+
+@lru_cache(maxsize=None)
+def get_sentiment_analyzer():
+    """
+    Return a shared SentimentIntensityAnalyzer so the VADER lexicon is only loaded once.
+
+    The lexicon is downloaded on first use rather than at import time, so modules
+    that only need TextBlob scoring never touch the network.
+
+    Returns:
+        SentimentIntensityAnalyzer: Process-wide analyzer instance.
+    """
+    nltk.download('vader_lexicon', quiet=True)
+    return SentimentIntensityAnalyzer()
+
+
+def score_sentiment(texts, model='vader'):
+    """
+    Score a batch of texts in-process.
+
+    VADER returns the compound score and scores missing text as 0. TextBlob returns
+    the polarity and scores missing or unparseable text as None.
+
+    Args:
+        texts (iterable): Texts to score; None/NaN entries are treated as missing.
+        model (str): Either 'vader' or 'textblob'.
+
+    Returns:
+        list: One score per input text, in input order.
+    """
+    if model not in SENTIMENT_MODELS:
+        raise ValueError(f"Unknown sentiment model '{model}'. Expected one of {SENTIMENT_MODELS}.")
+
+    if model == 'vader':
+        sia = get_sentiment_analyzer()
+        return [sia.polarity_scores(str(x))['compound'] if pd.notna(x) else 0 for x in texts]
+
+    scores = []
+    for x in texts:
+        if not pd.notna(x):
+            scores.append(None)
+            continue
+        try:
+            scores.append(TextBlob(str(x)).sentiment.polarity)
+        except Exception as e:
+            logging.error(f"Error in sentiment analysis: {e}")
+            scores.append(None)
+    return scores
@@ -0,0 +1,361 @@
+import argparse
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+from scripts.sentiment_scoring import SENTIMENT_MODELS, get_sentiment_analyzer, score_sentiment
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Environment variable holding the service URL, e.g. "http://127.0.0.1:8765"
+SERVICE_URL_ENV = 'SENTIMENT_SERVICE_URL'
+
+# Largest number of texts scored in one batch, and sent by the client in one request
+DEFAULT_MAX_BATCH_SIZE = 256
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent scoring requests into micro-batches.
+
+    Requests are queued and a single worker thread drains them, closing a batch once
+    adding the next request would exceed `max_batch_size` texts or `max_latency`
+    seconds have passed since its first request arrived. Requests larger than
+    `max_batch_size` are split across several batches, so no batch exceeds it. Each
+    batch is scored with one call per model.
+    """
+
+    def __init__(self, score_fn=score_sentiment, max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_latency=0.01):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        if max_latency < 0:
+            raise ValueError("max_latency must be non-negative.")
+
+        self.score_fn = score_fn
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+
+        self._queue = queue.Queue()
+        # Request held over because it did not fit in the previous batch (worker thread only)
+        self._pending = None
+        self._stop = threading.Event()
+        self._worker = None
+        self._lock = threading.Lock()
+        self._started_at = None
+        self._counters = {
+            'requests': 0,
+            'texts': 0,
+            'batches': 0,
+            'errors': 0,
+            'latency_total': 0.0,
+            'latency_max': 0.0,
+        }
+
+    def start(self):
+        """Start the worker thread."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._stop.clear()
+        self._started_at = time.monotonic()
+        self._worker = threading.Thread(target=self._run, name='sentiment-batcher', daemon=True)
+        self._worker.start()
+
+    def stop(self):
+        """Stop the worker thread once the queued requests have been served."""
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+    def submit(self, texts, model='vader', timeout=None):
+        """
+        Queue texts for scoring and block until their scores are available.
+
+        Parameters:
+            texts (list): Texts to score.
+            model (str): Either 'vader' or 'textblob'.
+            timeout (float): Seconds to wait for the result; None waits indefinitely.
+
+        Returns:
+            list: One score per input text.
+        """
+        if model not in SENTIMENT_MODELS:
+            raise ValueError(f"Unknown sentiment model '{model}'. Expected one of {SENTIMENT_MODELS}.")
+        if self._worker is None:
+            raise RuntimeError("MicroBatcher has not been started.")
+
+        texts = list(texts)
+        submitted = time.monotonic()
+        futures = []
+        for start in range(0, len(texts), self.max_batch_size):
+            future = Future()
+            self._queue.put((texts[start:start + self.max_batch_size], model, future, submitted))
+            futures.append(future)
+
+        deadline = None if timeout is None else submitted + timeout
+        scores = []
+        try:
+            for future in futures:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                scores.extend(future.result(timeout=remaining))
+        except Exception:
+            with self._lock:
+                self._counters['errors'] += 1
+            raise
+
+        # Counted once per call, however many batches the texts were split across
+        latency = time.monotonic() - submitted
+        with self._lock:
+            self._counters['requests'] += 1
+            self._counters['latency_total'] += latency
+            self._counters['latency_max'] = max(self._counters['latency_max'], latency)
+        return scores
+
+    def stats(self):
+        """
+        Return throughput and latency counters.
+
+        Returns:
+            dict: Request, text and batch counts, mean/max request latency in
+            milliseconds and texts scored per second since start. Requests and
+            errors count `submit` calls, even when one is split across batches.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+        uptime = time.monotonic() - self._started_at if self._started_at else 0.0
+        requests = counters['requests']
+        return {
+            'requests': requests,
+            'texts': counters['texts'],
+            'batches': counters['batches'],
+            'errors': counters['errors'],
+            'mean_batch_size': counters['texts'] / counters['batches'] if counters['batches'] else 0.0,
+            'mean_latency_ms': 1000 * counters['latency_total'] / requests if requests else 0.0,
+            'max_latency_ms': 1000 * counters['latency_max'],
+            'texts_per_second': counters['texts'] / uptime if uptime else 0.0,
+            'uptime_seconds': uptime,
+            'max_batch_size': self.max_batch_size,
+            'max_latency_ms_config': 1000 * self.max_latency,
+        }
+
+    def _collect_batch(self):
+        """Block for the first request, then gather more until the batch is full or due."""
+        if self._pending is not None:
+            first, self._pending = self._pending, None
+        else:
+            try:
+                first = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                return []
+
+        batch = [first]
+        size = len(first[0])
+        deadline = first[3] + self.max_latency
+        while size < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if size + len(item[0]) > self.max_batch_size:
+                self._pending = item
+                break
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    def _run(self):
+        while not (self._stop.is_set() and self._queue.empty() and self._pending is None):
+            batch = self._collect_batch()
+            if batch:
+                self._score_batch(batch)
+
+    def _score_batch(self, batch):
+        by_model = {}
+        for item in batch:
+            by_model.setdefault(item[1], []).append(item)
+
+        for model, items in by_model.items():
+            texts = [text for item in items for text in item[0]]
+            try:
+                scores = self.score_fn(texts, model=model)
+            except Exception as e:
+                logging.error(f"Error scoring batch of {len(texts)} texts: {e}")
+                for item in items:
+                    item[2].set_exception(e)
+                continue
+
+            offset = 0
+            for texts_in, _, future, _ in items:
+                future.set_result(scores[offset:offset + len(texts_in)])
+                offset += len(texts_in)
+
+            with self._lock:
+                self._counters['texts'] += len(texts)
+                self._counters['batches'] += 1
+
+
+class _SentimentRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler exposing POST /score and GET /stats."""
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            logging.warning(f"Client {self.address_string()} disconnected before the response was sent.")
+
+    def do_GET(self):
+        if self.path == '/stats':
+            self._send_json(200, self.server.batcher.stats())
+        elif self.path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        else:
+            self._send_json(404, {'error': f"Unknown path '{self.path}'."})
+
+    def do_POST(self):
+        if self.path != '/score':
+            self._send_json(404, {'error': f"Unknown path '{self.path}'."})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'{}')
+            texts = payload.get('texts')
+            if not isinstance(texts, list):
+                raise ValueError("Request body must contain a 'texts' list.")
+            scores = self.server.batcher.submit(texts, model=payload.get('model', 'vader'))
+        except ValueError as e:
+            self._send_json(400, {'error': str(e)})
+            return
+        except Exception as e:
+            logging.error(f"Error serving score request: {e}")
+            self._send_json(500, {'error': str(e)})
+            return
+        self._send_json(200, {'scores': scores})
+
+    def log_message(self, format, *args):
+        logging.debug(f"{self.address_string()} - {format % args}")
+
+
+class SentimentServer(ThreadingHTTPServer):
+    """Threaded HTTP server with a listen backlog sized for many concurrent clients."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def create_server(host='127.0.0.1', port=8765, max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_latency=0.01):
+    """
+    Create a sentiment scoring server with a warm lexicon and a running batcher.
+
+    Parameters:
+        host (str): Interface to bind.
+        port (int): Port to bind; 0 picks a free port.
+        max_batch_size (int): Maximum number of texts scored in one batch.
+        max_latency (float): Maximum seconds a request waits for its batch to fill.
+
+    Returns:
+        SentimentServer: Server with a `batcher` attribute; call `serve_forever()` to run it.
+    """
+    # Load the VADER lexicon up front so the first request does not pay for it
+    get_sentiment_analyzer()
+
+    batcher = MicroBatcher(max_batch_size=max_batch_size, max_latency=max_latency)
+    batcher.start()
+
+    server = SentimentServer((host, port), _SentimentRequestHandler)
+    server.batcher = batcher
+    logging.info(f"Sentiment service listening on http://{host}:{server.server_port}")
+    return server
+
+
+def _post_scores(service_url, texts, model, timeout):
+    """Score one chunk of texts on the service; returns None if the service cannot serve it."""
+    request = urllib.request.Request(
+        service_url.rstrip('/') + '/score',
+        data=json.dumps({'texts': texts, 'model': model}).encode('utf-8'),
+        headers={'Content-Type': 'application/json'},
+        method='POST',
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            scores = json.loads(response.read())['scores']
+    except (urllib.error.URLError, OSError, ValueError, KeyError) as e:
+        logging.warning(f"Sentiment service unavailable ({e}); scoring in-process.")
+        return None
+    if len(scores) != len(texts):
+        logging.warning("Sentiment service returned a mismatched number of scores; scoring in-process.")
+        return None
+    return scores
+
+
+def score_texts(texts, model='vader', service_url=None, timeout=5.0, chunk_size=DEFAULT_MAX_BATCH_SIZE):
+    """
+    Score texts through the sentiment service, falling back to in-process scoring.
+
+    The service is used when `service_url` is given or the SENTIMENT_SERVICE_URL
+    environment variable is set. Texts are sent in chunks of at most `chunk_size`,
+    so each request fits in one service batch. If the service is unset, or a chunk
+    fails or times out, that chunk and the remaining ones are scored locally with
+    the same scorer; chunks already scored by the service are kept.
+
+    Parameters:
+        texts (list): Texts to score; None/NaN entries are treated as missing.
+        model (str): Either 'vader' or 'textblob'.
+        service_url (str): Base URL of the service, e.g. 'http://127.0.0.1:8765'.
+        timeout (float): Seconds to wait for each chunk before falling back.
+        chunk_size (int): Maximum number of texts sent in one request.
+
+    Returns:
+        list: One score per input text.
+    """
+    texts = [str(x) if pd.notna(x) else None for x in texts]
+    service_url = service_url or os.environ.get(SERVICE_URL_ENV)
+    if not service_url:
+        return score_sentiment(texts, model=model)
+
+    scores = []
+    for start in range(0, len(texts), chunk_size):
+        chunk = _post_scores(service_url, texts[start:start + chunk_size], model, timeout)
+        if chunk is None:
+            return scores + score_sentiment(texts[start:], model=model)
+        scores.extend(chunk)
+    return scores
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the local sentiment scoring service.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--max-batch-size', type=int, default=DEFAULT_MAX_BATCH_SIZE)
+    parser.add_argument('--max-latency-ms', type=float, default=10.0)
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.max_batch_size, args.max_latency_ms / 1000)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.batcher.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,8 @@
-from nltk.sentiment import SentimentIntensityAnalyzer
 from wordcloud import WordCloud
 import matplotlib.pyplot as plt
 import pandas as pd
 import nltk
+from scripts.sentiment_service import score_texts
 
 # Download resources if not already downloaded
 nltk.download('vader_lexicon', quiet=True)
@@ -12,6 +12,8 @@ def sentiment_analysis(df, text_col):
     """
     Perform sentiment analysis on a text column using NLTK's SentimentIntensityAnalyzer.
     Adds sentiment scores to the dataframe and visualizes the sentiment distribution.
+    Scores come from the local sentiment service when one is configured, otherwise
+    they are computed in-process.
 
     Args:
         df (pd.DataFrame): Input dataframe containing the text column.
@@ -23,12 +25,8 @@ def sentiment_analysis(df, text_col):
     if text_col not in df.columns:
         raise ValueError(f"Column '{text_col}' does not exist in the DataFrame.")
 
-    sia = SentimentIntensityAnalyzer()
-
     # Apply sentiment analysis, handle missing or non-string data
-    df['sentiment'] = df[text_col].apply(lambda x: 
-                                        sia.polarity_scores(str(x))['compound'] 
-                                        if pd.notna(x) else 0)
+    df['sentiment'] = score_texts(df[text_col].tolist(), model='vader')
 
     # Sentiment Bins: Negative [-1, -0.5), Neutral [-0.5, 0.5), Positive [0.5, 1]
     bins = [-1.1, -0.5, 0.5, 1.1]
@@ -0,0 +1,181 @@
+import logging
+
+import pandas as pd
+
+from scripts.technical_indicators import calculate_technical_indicators
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Pyramid levels from finest to coarsest: name -> (pandas period frequency, approximate length in seconds)
+LEVELS = {
+    '1h': ('h', 3600),
+    'D': ('D', 86400),
+    'W': ('W-FRI', 7 * 86400),
+    'M': ('M', 31 * 86400),
+}
+
+# Level each coarser level is aggregated from. Its periods must nest inside the source's:
+# W-FRI weeks straddle month ends, so monthly bars come from daily bars, not weekly ones
+SOURCE_LEVELS = {
+    '1h': 'native',
+    'D': '1h',
+    'W': 'D',
+    'M': 'D',
+}
+
+# How each OHLCV column is combined when bars are merged into a coarser bar
+OHLCV_AGGREGATION = {
+    'Open': 'first',
+    'High': 'max',
+    'Low': 'min',
+    'Close': 'last',
+    'Adj Close': 'last',
+    'Volume': 'sum',
+}
+
+INDICATOR_COLUMNS = ['SMA_50', 'SMA_200', 'RSI', 'MACD', 'MACD_Signal', 'MACD_Hist']
+
+# Bars of history recomputed before the first changed bar. Covers the 200-bar SMA and lets
+# the RSI/MACD exponential smoothing converge to the full-history values.
+INDICATOR_WARMUP = 500
+
+
+def _detect_level(index):
+    """Name of the finest pyramid level at or above the native bar spacing."""
+    if len(index) < 2:
+        return 'D'
+    spacing = pd.Series(index).diff().median().total_seconds()
+    if spacing >= LEVELS['D'][1]:
+        return 'D'
+    if spacing >= LEVELS['1h'][1]:
+        return '1h'
+    return 'native'
+
+
+def _aggregate(fine, level):
+    """Merge finer bars into bars of `level`, labelled like pandas resample."""
+    freq = LEVELS[level][0]
+    periods = fine.index.to_period(freq)
+    agg = {col: how for col, how in OHLCV_AGGREGATION.items() if col in fine.columns}
+    bars = fine[list(agg)].groupby(periods).agg(agg)
+    # Weekly and monthly bars are labelled by their last day, intraday and daily bars by their start
+    if level in ('W', 'M'):
+        bars.index = bars.index.to_timestamp(how='end').normalize()
+    else:
+        bars.index = bars.index.to_timestamp(how='start')
+    bars.index.name = fine.index.name
+    return bars
+
+
+def _with_indicators(bars, changed_from=0, previous=None):
+    """Recompute indicator columns from row `changed_from` on, reusing `previous` before it."""
+    start = max(0, changed_from - INDICATOR_WARMUP)
+    tail = calculate_technical_indicators(bars.iloc[start:])[INDICATOR_COLUMNS]
+    tail = tail[tail.index >= bars.index[changed_from]]
+    if previous is None or changed_from == 0:
+        return bars.join(tail)
+    head = previous[INDICATOR_COLUMNS].iloc[:changed_from]
+    return bars.join(pd.concat([head, tail]))
+
+
+class TimeframePyramid:
+    """
+    OHLCV bars at several timeframes with cached technical indicators.
+
+    The native bars (as returned by `prepare_stock_data`) form the finest level and
+    each coarser level (hourly, daily, weekly, monthly) is aggregated with
+    first/max/min/last/sum rules from the finest level whose periods nest inside it
+    (see `SOURCE_LEVELS`). Every level stores SMA, RSI and MACD
+    columns. `update` only rebuilds the trailing bars touched by new data, together
+    with their indicator values.
+    """
+
+    def __init__(self, df):
+        try:
+            if not isinstance(df.index, pd.DatetimeIndex):
+                raise ValueError("The DataFrame must have a DatetimeIndex, as returned by prepare_stock_data.")
+            if 'Close' not in df.columns:
+                raise ValueError("The DataFrame must contain a 'Close' column.")
+
+            df = df.drop(columns=INDICATOR_COLUMNS, errors='ignore').sort_index()
+            self.native_level = _detect_level(df.index)
+            names = list(LEVELS)
+            finer = names.index(self.native_level) + 1 if self.native_level in LEVELS else 0
+            self.level_names = [self.native_level] + names[finer:]
+
+            self._bars = {self.native_level: df}
+            for name in self.level_names[1:]:
+                self._bars[name] = _aggregate(self._bars[self._source(name)], name)
+            self._levels = {name: _with_indicators(bars) for name, bars in self._bars.items()}
+
+            logging.info(f"Timeframe pyramid built with levels {self.level_names}.")
+
+        except Exception as e:
+            logging.error(f"Error building timeframe pyramid: {e}")
+            raise
+
+    def level(self, name):
+        """
+        Bars and indicators for one level.
+
+        Parameters:
+            name (str): One of `level_names`, e.g. 'D', 'W' or 'M'.
+
+        Returns:
+            pd.DataFrame: OHLCV bars with SMA_50, SMA_200, RSI and MACD columns.
+        """
+        if name not in self._levels:
+            raise KeyError(f"Unknown level '{name}'. Available levels: {self.level_names}")
+        return self._levels[name]
+
+    def update(self, new_df):
+        """
+        Add new or revised native bars and refresh only the affected trailing bars.
+
+        Native rows at or after the first timestamp in `new_df` are replaced. At each
+        coarser level, bars from the period containing that timestamp onward (normally
+        just the incomplete last bar) are re-aggregated and their indicators refreshed.
+
+        Parameters:
+            new_df (pd.DataFrame): New native bars with the same columns and index type.
+
+        Returns:
+            TimeframePyramid: self, for chaining.
+        """
+        try:
+            if new_df.empty:
+                return self
+            new_df = new_df.drop(columns=INDICATOR_COLUMNS, errors='ignore').sort_index()
+            changed_from = new_df.index[0]
+
+            native = self._bars[self.native_level]
+            native = pd.concat([native[native.index < changed_from], new_df])
+            self._refresh(self.native_level, native, changed_from)
+
+            for name in self.level_names[1:]:
+                fine = self._bars[self._source(name)]
+                bars = self._bars[name]
+                # Bars from the period containing the first change onward are rebuilt from finer bars;
+                # both start- and end-labelled bars of that period sort at or after its start time
+                period_start = changed_from.to_period(LEVELS[name][0]).start_time
+                keep = bars.iloc[:bars.index.searchsorted(period_start)]
+                rebuilt = _aggregate(fine.iloc[fine.index.searchsorted(period_start):], name)
+                self._refresh(name, pd.concat([keep, rebuilt]), rebuilt.index[0])
+
+            logging.info(f"Timeframe pyramid updated from {changed_from}.")
+            return self
+
+        except Exception as e:
+            logging.error(f"Error updating timeframe pyramid: {e}")
+            raise
+
+    def _source(self, name):
+        """Level that bars of `name` are aggregated from, falling back to the native bars."""
+        source = SOURCE_LEVELS[name]
+        return source if source in self._bars else self.native_level
+
+    def _refresh(self, name, bars, changed_from):
+        position = int(bars.index.searchsorted(changed_from))
+        self._bars[name] = bars
+        self._levels[name] = _with_indicators(bars, position, self._levels[name])
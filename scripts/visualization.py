@@ -1,12 +1,23 @@
 import matplotlib.pyplot as plt
+import numpy as np
+from scripts.downsampling import linear_fit
 
-def plot_correlation(sentiment_scores, daily_returns):
+# Above this many points the scatter is drawn as a hexbin density instead of markers
+MAX_SCATTER_POINTS = 10_000
+
+
+def plot_correlation(sentiment_scores, daily_returns, max_scatter_points=MAX_SCATTER_POINTS, gridsize=60):
     """
     Plots sentiment scores against stock returns for correlation visualization.
 
+    Large inputs are aggregated into a hexbin density plot so rendering time does
+    not grow with the number of points.
+
     Args:
         sentiment_scores (pd.Series or list): Sentiment scores.
         daily_returns (pd.Series or list): Corresponding daily stock returns.
+        max_scatter_points (int): Largest input drawn as individual markers.
+        gridsize (int): Number of hexagons across the x-axis for large inputs.
 
     Returns:
         None
@@ -15,20 +26,30 @@ def plot_correlation(sentiment_scores, daily_returns):
     if len(sentiment_scores) != len(daily_returns):
         raise ValueError("Sentiment scores and daily returns must be of the same length.")
 
+    x = np.asarray(sentiment_scores, dtype=float)
+    y = np.asarray(daily_returns, dtype=float)
+
+    finite = np.isfinite(x) & np.isfinite(y)
+
     plt.figure(figsize=(10, 6))
-    plt.scatter(sentiment_scores, daily_returns, alpha=0.7, c='b', edgecolor='k', marker='o')
+    if len(x) > max_scatter_points:
+        plt.hexbin(x[finite], y[finite], gridsize=gridsize, bins='log', cmap='Blues', mincnt=1)
+        plt.colorbar(label='Count (log scale)')
+    else:
+        plt.scatter(x, y, alpha=0.7, c='b', edgecolor='k', marker='o')
     plt.title("Correlation Between Sentiment Scores and Stock Returns")
     plt.xlabel("Sentiment Scores")
     plt.ylabel("Daily Stock Returns")
     plt.grid(True, linestyle='--', alpha=0.6)
-    
+
     # Optionally, display a line of best fit (regression line)
-    if len(sentiment_scores) > 1:
-        # Fit a linear regression line to the scatter plot
-        from numpy import polyfit
-        coefficients = polyfit(sentiment_scores, daily_returns, 1)
-        plt.plot(sentiment_scores, coefficients[0] * sentiment_scores + coefficients[1], color='r', linestyle='--', label=f'Fit: y={coefficients[0]:.2f}x + {coefficients[1]:.2f}')
-        plt.legend(loc='best')
+    if len(x) > 1:
+        # Fit a linear regression line; two end points are enough to draw it
+        slope, intercept, r, _ = linear_fit(x, y)
+        if np.isfinite(slope):
+            x_line = np.array([x[finite].min(), x[finite].max()])
+            plt.plot(x_line, slope * x_line + intercept, color='r', linestyle='--', label=f'Fit: y={slope:.2f}x + {intercept:.2f} (r={r:.2f})')
+            plt.legend(loc='best')
 
     plt.tight_layout()
     plt.show()
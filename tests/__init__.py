@@ -1,4 +1,4 @@
 # Import test modules if needed for test discovery
-from .test_analysis import test_load_news_data, test_sentiment_analysis
+from .test_analysis import test_descriptive_statistics, test_basic_statistics
 
-__all__ = ["test_load_news_data", "test_sentiment_analysis"]
+__all__ = ["test_descriptive_statistics", "test_basic_statistics"]
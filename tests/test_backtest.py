@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('talib')
+
+from scripts.backtest import backtest_sentiment, build_sentiment_panel
+
+DATES = pd.bdate_range('2020-06-01', periods=5)  # Mon 1 Jun .. Fri 5 Jun
+CLOSE = pd.DataFrame({'AAPL': [100.0, 110.0, 99.0, 99.0, 108.9]}, index=DATES)
+
+
+def test_news_after_close_goes_to_next_trading_date():
+    dates = pd.bdate_range('2020-06-01', periods=10)
+    news = pd.DataFrame({
+        'date': [
+            '2020-06-05 15:00:00-04:00',  # before the close -> Fri 5 Jun
+            '2020-06-05 18:00:00-04:00',  # after the close -> Mon 8 Jun
+            '2020-06-05 21:00:00-04:00',  # after midnight UTC, still Fri evening in New York -> Mon 8 Jun
+            '2020-06-02 09:00:00-05:00',  # different offset, 10:00 New York -> Tue 2 Jun
+        ],
+        'stock': ['AAPL'] * 4,
+        'sentiment': [0.2, 0.4, 0.6, -0.5],
+    })
+
+    panel = build_sentiment_panel(news, dates, ['AAPL'])
+
+    assert panel.loc['2020-06-05', 'AAPL'] == pytest.approx(0.2)
+    assert panel.loc['2020-06-08', 'AAPL'] == pytest.approx(0.5)
+    assert panel.loc['2020-06-02', 'AAPL'] == pytest.approx(-0.5)
+    assert panel['AAPL'].abs().sum() == pytest.approx(1.2)
+
+
+def test_news_outside_panel_dates_is_dropped():
+    dates = pd.bdate_range('2015-01-05', periods=5)
+    news = pd.DataFrame({
+        'date': ['2010-03-01', '2012-07-16 10:00:00-04:00', '2015-01-05 09:00:00-05:00', '2016-01-04'],
+        'stock': ['AAPL'] * 4,
+        'sentiment': [0.8, 0.8, 0.1, 0.9],
+    })
+
+    panel = build_sentiment_panel(news, dates, ['AAPL'])
+
+    # Only the headline inside the panel's date range counts
+    assert panel.loc['2015-01-05', 'AAPL'] == pytest.approx(0.1)
+    assert panel['AAPL'].abs().sum() == pytest.approx(0.1)
+
+
+def test_pnl_matches_hand_computation():
+    # Returns: 0, +10%, -10%, 0, +10%. A long signal on day 0 is entered at day 0's close.
+    sentiment = pd.DataFrame({'AAPL': [1.0, 0.0, 0.0, 0.0, 0.0]}, index=DATES)
+
+    stats, equity = backtest_sentiment(CLOSE, sentiment, thresholds=[0.5], holding_periods=[1, 2], cost_bps=10)
+
+    # h=1: long over day 1 (+10%), buy cost on day 1, sell cost on day 2
+    after_exit = (1.1 - 0.001) * (1 - 0.001)
+    expected_h1 = [1.0, 1.1 - 0.001, after_exit, after_exit, after_exit]
+    # h=2: half position over days 1 and 2, half-size trades on days 1 and 3
+    day1 = 1 + 0.5 * 0.1 - 0.0005
+    day2 = day1 * (1 - 0.5 * 0.1)
+    day3 = day2 * (1 - 0.0005)
+    expected_h2 = [1.0, day1, day2, day3, day3]
+
+    np.testing.assert_allclose(equity[0].to_numpy(), expected_h1)
+    np.testing.assert_allclose(equity[1].to_numpy(), expected_h2)
+    assert stats.loc[0, 'total_return'] == pytest.approx(1.099 * 0.999 - 1)
+    assert stats.loc[1, 'holding_period'] == 2
+
+
+def test_short_signal_and_threshold():
+    sentiment = pd.DataFrame({'AAPL': [0.0, -0.8, 0.3, 0.0, 0.0]}, index=DATES)
+
+    stats, equity = backtest_sentiment(CLOSE, sentiment, thresholds=[0.5], cost_bps=0)
+
+    # Short from day 1's close over day 2 (-10%) gains 10%; the 0.3 signal is below the threshold
+    np.testing.assert_allclose(equity[0].to_numpy(), [1.0, 1.0, 1.1, 1.1, 1.1])
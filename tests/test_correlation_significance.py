@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+from scripts.correlation_significance import (
+    _bootstrap_indices, _permutation_indices, correlation_significance, correlation_significance_by_ticker,
+)
+
+
+def make_pairs():
+    rng = np.random.default_rng(0)
+    pairs = {}
+    for ticker, beta in [('AAPL', 0.4), ('MSFT', 0.0), ('GOOG', 0.1)]:
+        x = rng.normal(size=300)
+        pairs[ticker] = (pd.Series(x), pd.Series(beta * x + rng.normal(size=300)))
+    return pairs
+
+
+def test_results_do_not_depend_on_worker_count():
+    pairs = make_pairs()
+
+    serial = correlation_significance_by_ticker(pairs, n_resamples=600, chunk_size=200, n_workers=1)
+    parallel = correlation_significance_by_ticker(pairs, n_resamples=600, chunk_size=200, n_workers=2)
+
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_strong_correlation_is_significant_and_ci_contains_r():
+    result = correlation_significance_by_ticker(make_pairs(), n_resamples=500, n_workers=1)
+
+    assert result.loc['AAPL', 'p_value'] < 0.01
+    assert result.loc['MSFT', 'p_value'] > 0.05
+    assert (result['ci_lower'] < result['r']).all() and (result['r'] < result['ci_upper']).all()
+    assert (result['n_resamples'] == 500).all()
+
+
+def test_single_series_drops_nan_pairs():
+    x, y = make_pairs()['GOOG']
+    x = x.copy()
+    x.iloc[0] = np.nan
+
+    single = correlation_significance(x, y, n_resamples=200)
+
+    assert single['n'] == 299
+    assert np.isclose(single['r'], np.corrcoef(x[1:], y[1:])[0, 1])
+
+
+def test_resample_indices_shapes_and_permutations():
+    rng = np.random.default_rng(0)
+
+    boot = _bootstrap_indices(rng, 10, 3, 5)
+    perm = _permutation_indices(rng, 10, 3, 5)
+
+    assert boot.shape == perm.shape == (5, 10)
+    assert ((boot >= 0) & (boot < 10)).all()
+    assert (np.sort(perm, axis=1) == np.arange(10)).all()
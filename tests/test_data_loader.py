@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+
+from scripts.data_loader import load_stock_data, load_stock_files, load_stock_store
+
+
+@pytest.fixture
+def price_files(tmp_path):
+    files = {}
+    for ticker, rows in {
+        'MSFT': '2020-01-03,12\n2020-01-02,11\n',
+        'AAPL': '2020-01-02,1\nnot a date,9\n2020-01-03,2\n',
+        'TSLA': '2020-01-02,5\n',
+    }.items():
+        path = tmp_path / f'{ticker}_historical_data.csv'
+        path.write_text('Date,Close\n' + rows)
+        files[ticker] = str(path)
+    return files
+
+
+def test_load_stock_files_keeps_input_order(price_files):
+    frames = load_stock_files(price_files, max_workers=1)
+
+    assert list(frames) == ['MSFT', 'AAPL', 'TSLA']
+    for ticker, path in price_files.items():
+        pd.testing.assert_frame_equal(frames[ticker], load_stock_data(path))
+
+
+def test_load_stock_files_does_not_depend_on_max_workers(price_files):
+    serial = load_stock_files(price_files, max_workers=1)
+    threaded = load_stock_files(price_files, max_workers=8)
+
+    assert list(serial) == list(threaded)
+    for ticker in serial:
+        pd.testing.assert_frame_equal(serial[ticker], threaded[ticker])
+
+
+def test_load_stock_store_sorts_and_drops_invalid_dates(price_files, tmp_path):
+    store = load_stock_store(price_files, str(tmp_path / 'prices.store'))
+
+    assert store.tickers == ['AAPL', 'MSFT', 'TSLA']
+    assert list(store.frame('AAPL')['Close']) == [1, 2]
+    assert list(store.frame('MSFT').index) == [pd.Timestamp('2020-01-02'), pd.Timestamp('2020-01-03')]
+
+
+def test_load_stock_store_reuses_store_until_sources_change(price_files, tmp_path):
+    store_path = str(tmp_path / 'prices.store')
+    load_stock_store(price_files, store_path)
+
+    assert len(load_stock_store(price_files, store_path)) == 5
+
+    with open(price_files['TSLA'], 'a') as f:
+        f.write('2020-01-03,6\n')
+    assert list(load_stock_store(price_files, store_path).frame('TSLA')['Close']) == [5, 6]
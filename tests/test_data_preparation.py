@@ -0,0 +1,63 @@
+import pandas as pd
+import pytest
+
+from scripts.data_preparation import load_stock_data, load_stock_directory, ticker_from_filename
+
+COLUMNS = 'Date,Open,High,Low,Close,Adj Close,Volume\n'
+
+
+def write_prices(directory, ticker, rows):
+    path = directory / f'{ticker}_historical_data.csv'
+    path.write_text(COLUMNS + ''.join(f'{date},1,2,0.5,{close},{close},100\n' for date, close in rows))
+    return path
+
+
+@pytest.fixture
+def price_dir(tmp_path):
+    write_prices(tmp_path, 'MSFT', [('2020-01-03', 12.0), ('2020-01-02', 11.0)])
+    write_prices(tmp_path, 'AAPL', [('2020-01-02', 1.0), ('not a date', 9.0), ('2020-01-03', 2.0)])
+    write_prices(tmp_path, 'TSLA', [])
+    return tmp_path
+
+
+def test_ticker_from_filename():
+    assert ticker_from_filename('/data/AAPL_historical_data.csv') == 'AAPL'
+    assert ticker_from_filename('GOOG.csv') == 'GOOG'
+
+
+def test_panel_indexed_by_ticker_and_date(price_dir):
+    panel = load_stock_directory(str(price_dir))
+
+    assert panel.index.names == ['ticker', 'Date']
+    # The empty TSLA file is skipped
+    assert list(panel.index.get_level_values('ticker').unique()) == ['AAPL', 'MSFT']
+    assert list(panel.loc['MSFT', 'Close']) == [11.0, 12.0]
+    assert panel.index.is_monotonic_increasing
+
+
+def test_invalid_dates_dropped_like_load_stock_data(price_dir):
+    panel = load_stock_directory(str(price_dir))
+    single = load_stock_data(str(price_dir / 'AAPL_historical_data.csv')).set_index('Date')
+
+    pd.testing.assert_frame_equal(panel.loc['AAPL'], single.sort_index(), check_names=False)
+    assert list(panel.loc['AAPL', 'Close']) == [1.0, 2.0]
+
+
+def test_output_does_not_depend_on_max_workers(price_dir):
+    pd.testing.assert_frame_equal(load_stock_directory(str(price_dir), max_workers=1),
+                                  load_stock_directory(str(price_dir), max_workers=8))
+
+
+def test_duplicate_tickers_raise(tmp_path):
+    write_prices(tmp_path, 'AAPL', [('2020-01-02', 1.0)])
+    (tmp_path / 'AAPL_prices.csv').write_text(COLUMNS + '2020-01-02,1,2,0.5,1,1,100\n')
+
+    with pytest.raises(ValueError, match='same ticker'):
+        load_stock_directory(str(tmp_path))
+
+
+def test_missing_directory_and_no_matches(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_stock_directory(str(tmp_path / 'missing'))
+    with pytest.raises(ValueError, match='No files'):
+        load_stock_directory(str(tmp_path))
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from scripts.data_store import TickerDateStore, build_store, open_store, source_signature
+
+NEWS = pd.DataFrame({
+    'stock': ['B', 'A', 'A', 'A', 'B', 'A', None],
+    'date': [
+        '2020-06-05 09:00:00-04:00',
+        '2020-06-05 10:30:00-04:00',
+        '2020-06-04 15:00:00-04:00',
+        '2020-06-05 21:00:00-04:00',  # already 6 Jun in UTC; still 5 Jun in New York
+        'not a date',
+        '2020-06-08 08:00:00-04:00',
+        '2020-06-05 12:00:00-04:00',
+    ],
+    'headline': ['b1', 'a2', 'a1', None, 'b2', 'a4 é', 'x'],
+    'publisher': ['P', np.nan, 'Q', 'P', 'P', 'Q', 'P'],
+    'score': [0.5, 0.2, 0.1, 0.3, 0.9, 0.4, 0.0],
+})
+
+
+@pytest.fixture
+def store(tmp_path):
+    return build_store(NEWS, str(tmp_path / 'news.store'), ticker_col='stock', date_col='date')
+
+
+def test_rows_sorted_per_ticker_and_invalid_rows_dropped(store):
+    assert store.tickers == ['A', 'B']
+    assert len(store) == 5
+    assert list(store.frame('A')['score']) == [0.1, 0.2, 0.3, 0.4]
+    assert list(store.frame('B')['headline']) == ['b1']
+
+
+def test_date_only_end_includes_whole_day_in_exchange_time(store):
+    frame = store.frame('A', '2020-06-04', '2020-06-05')
+
+    assert list(frame['score']) == [0.1, 0.2, 0.3]
+    assert frame.index[-1] == pd.Timestamp('2020-06-05 21:00')
+
+
+def test_time_bounds_are_inclusive_and_tz_aware_bounds_converted(store):
+    assert list(store.frame('A', '2020-06-05 10:30', '2020-06-05 21:00')['score']) == [0.2, 0.3]
+    assert list(store.frame('A', end='2020-06-05 20:59')['score']) == [0.1, 0.2]
+    # 2020-06-06 01:00 UTC is 21:00 on 5 Jun in New York
+    assert list(store.frame('A', start=pd.Timestamp('2020-06-06 01:00', tz='UTC'))['score']) == [0.3, 0.4]
+    assert store.frame('A', '2020-06-06', '2020-06-07').empty
+
+
+def test_strings_keep_missing_values(store):
+    arrays = store.arrays('A', columns=['headline', 'publisher'])
+
+    assert list(arrays['headline']) == ['a1', 'a2', None, 'a4 é']
+    assert list(arrays['publisher']) == ['Q', None, 'P', 'Q']
+
+
+def test_numeric_columns_are_views_of_the_memory_map(store):
+    score = store.arrays('A', '2020-06-05', '2020-06-05', columns=['score'])['score']
+
+    assert isinstance(score, np.memmap)
+    assert list(score) == [0.2, 0.3]
+
+
+def test_unknown_ticker_and_column(store):
+    with pytest.raises(KeyError):
+        store.locate('ZZZ')
+    with pytest.raises(KeyError):
+        store.arrays('A', columns=['missing'])
+
+
+def test_open_store_detects_stale_sources(tmp_path):
+    source = tmp_path / 'news.csv'
+    NEWS.to_csv(source, index=False)
+    path = str(tmp_path / 'news.store')
+    build_store(NEWS, path, 'stock', 'date', sources=source_signature([source]))
+
+    assert isinstance(open_store(path, source_signature([source])), TickerDateStore)
+    source.write_text('changed')
+    assert open_store(path, source_signature([source])) is None
@@ -0,0 +1,47 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from scripts.downsampling import downsample_indices, linear_fit, lttb_indices, minmax_indices
+
+
+def test_minmax_keeps_extremes_and_endpoints():
+    y = np.sin(np.linspace(0, 20, 10_000))
+    y[1234] = 50.0
+    y[8765] = -50.0
+
+    idx = minmax_indices(y, 200)
+
+    assert len(idx) <= 202
+    assert {0, 1234, 8765, len(y) - 1} <= set(idx)
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_lttb_with_tz_aware_index_emits_no_warnings():
+    x = pd.date_range('2020-01-01', periods=5_000, freq='min', tz='America/New_York')
+    y = np.cumsum(np.random.default_rng(0).normal(size=len(x)))
+    y[:10] = np.nan
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        idx = lttb_indices(x, y, 300)
+
+    assert len(idx) == 300
+    assert idx[0] == 10 and idx[-1] == len(y) - 1
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_short_series_is_not_downsampled():
+    assert list(downsample_indices(np.arange(5), np.arange(5), max_points=10)) == [0, 1, 2, 3, 4]
+
+
+def test_linear_fit_matches_polyfit_and_ignores_nan():
+    x = np.array([1.0, 2.0, 3.0, 4.0, np.nan])
+    y = np.array([2.0, 4.0, 6.0, 8.5, 1.0])
+
+    slope, intercept, r, n = linear_fit(x, y)
+
+    np.testing.assert_allclose([slope, intercept], np.polyfit(x[:4], y[:4], 1))
+    assert np.isclose(r, np.corrcoef(x[:4], y[:4])[0, 1])
+    assert n == 4
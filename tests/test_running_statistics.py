@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from scripts.descriptive_statistics import articles_per_publisher, basic_statistics, publication_trends
+from scripts.running_statistics import NewsStatistics, RunningMoments, TDigest, update_news_statistics
+
+
+def test_welford_merge_matches_numpy():
+    rng = np.random.default_rng(0)
+    a, b = rng.normal(5, 2, 1000), rng.exponential(3, 257)
+
+    merged = RunningMoments().update(a).merge(RunningMoments().update(b[:100]).update(b[100:]))
+    values = np.concatenate([a, b])
+
+    assert merged.count == len(values)
+    assert merged.mean == pytest.approx(values.mean())
+    assert merged.variance == pytest.approx(np.var(values, ddof=1))
+    assert (merged.minimum, merged.maximum) == (values.min(), values.max())
+
+
+def test_tdigest_quantiles_close_to_numpy():
+    rng = np.random.default_rng(1)
+    values = rng.lognormal(size=200_000)
+    digest = TDigest()
+    for chunk in np.array_split(values, 20):
+        digest.update(chunk)
+
+    q = [0.01, 0.25, 0.5, 0.75, 0.99]
+    np.testing.assert_allclose(digest.quantile(q), np.quantile(values, q), rtol=0.01)
+    assert digest.count == len(values)
+    assert len(digest.means) < 200
+
+
+@pytest.mark.parametrize('values', [[2, 3, 0], [1, 2, 3, 4, 5], [7, 7, 1, 30], [4]])
+def test_tdigest_quartiles_match_describe_on_small_inputs(values):
+    expected = pd.Series(values, dtype=float).describe()[['25%', '50%', '75%']].to_numpy()
+
+    np.testing.assert_allclose(TDigest().update(values).quantile([0.25, 0.5, 0.75]), expected)
+
+
+def test_tdigest_merge_matches_single_digest():
+    rng = np.random.default_rng(2)
+    a, b = rng.normal(size=50_000), rng.normal(3, 1, 50_000)
+
+    merged = TDigest().update(a).merge(TDigest().update(b))
+
+    q = [0.1, 0.5, 0.9]
+    np.testing.assert_allclose(merged.quantile(q), np.quantile(np.concatenate([a, b]), q), atol=0.05)
+
+
+def news_frame(n, offset=0):
+    rng = np.random.default_rng(offset)
+    return pd.DataFrame({
+        'headline': ['x' * k for k in rng.integers(1, 80, n)],
+        'publisher': rng.choice(['Benzinga', 'Reuters', None], n),
+        # Mixed -05:00/-04:00 offsets across the DST change, as in the news data
+        'date': [f'2020-0{1 + i % 6}-15 10:00:00{"-05:00" if i % 6 < 2 else "-04:00"}' for i in range(n)],
+    })
+
+
+def test_save_load_round_trip_and_appended_update(tmp_path):
+    df = pd.concat([news_frame(300), news_frame(200, offset=1)], ignore_index=True)
+    path = str(tmp_path / 'news.csv.stats.json')
+
+    update_news_statistics(df.iloc[:300], path)
+    stats = update_news_statistics(df, path)
+    reloaded = NewsStatistics.load(path)
+
+    assert stats.rows_seen == reloaded.rows_seen == 500
+    pd.testing.assert_series_equal(reloaded.describe_lengths(), stats.describe_lengths())
+    assert reloaded.publisher_counts == stats.publisher_counts
+
+    lengths = df['headline'].str.len()
+    summary = reloaded.describe_lengths()
+    assert summary['count'] == 500
+    assert summary['mean'] == pytest.approx(lengths.mean())
+    assert summary['std'] == pytest.approx(lengths.std())
+
+    expected_publishers = df['publisher'].value_counts()
+    assert reloaded.top_publishers(10).to_dict() == expected_publishers.to_dict()
+    assert reloaded.monthly_trends().sum() == 500
+    assert list(reloaded.monthly_trends().index.astype(str)) == [f'2020-0{m}' for m in range(1, 7)]
+
+
+def test_basic_statistics_with_stats_checks_column_and_leaves_frame_untouched():
+    df = news_frame(50)
+    original = df.copy()
+    stats = NewsStatistics(text_col='headline').update(df)
+
+    assert basic_statistics(df, 'headline', stats=stats)['count'] == 50
+    with pytest.raises(ValueError):
+        basic_statistics(df, 'publisher', stats=stats)
+
+    basic_statistics(df, 'headline')
+    pd.testing.assert_frame_equal(df, original)
+
+
+def test_publisher_and_trend_helpers_check_stats_columns(monkeypatch):
+    monkeypatch.setattr('matplotlib.pyplot.show', lambda: None)
+    df = news_frame(60)
+    stats = NewsStatistics().update(df)
+
+    assert articles_per_publisher(df, 'publisher', stats=stats).sum() == df['publisher'].notna().sum()
+    assert publication_trends(df, 'date', stats=stats).sum() == 60
+    with pytest.raises(ValueError):
+        articles_per_publisher(df, 'source', stats=stats)
+    with pytest.raises(ValueError):
+        publication_trends(df, 'published_at', stats=stats)
@@ -0,0 +1,86 @@
+import threading
+
+import pytest
+
+from scripts.sentiment_service import MicroBatcher, SentimentServer, _SentimentRequestHandler, score_texts
+
+
+def fake_score(texts, model='vader'):
+    return [float(len(t)) if t is not None else 0.0 for t in texts]
+
+
+@pytest.fixture
+def batcher():
+    batcher = MicroBatcher(score_fn=fake_score, max_batch_size=4, max_latency=0.01)
+    batcher.start()
+    yield batcher
+    batcher.stop()
+
+
+@pytest.fixture
+def service_url(batcher):
+    server = SentimentServer(('127.0.0.1', 0), _SentimentRequestHandler)
+    server.batcher = batcher
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_oversized_request_is_split_across_batches(batcher):
+    texts = ['x' * (i % 7) for i in range(10)]
+    assert batcher.submit(texts) == fake_score(texts)
+
+    stats = batcher.stats()
+    assert stats['requests'] == 1
+    assert stats['texts'] == 10
+    assert stats['batches'] == 3
+    assert stats['mean_batch_size'] <= batcher.max_batch_size
+
+
+def test_failed_split_request_counts_one_error():
+    def failing_score(texts, model='vader'):
+        raise RuntimeError("model unavailable")
+
+    batcher = MicroBatcher(score_fn=failing_score, max_batch_size=4, max_latency=0.01)
+    batcher.start()
+    try:
+        with pytest.raises(RuntimeError):
+            batcher.submit(['x'] * 10)
+    finally:
+        batcher.stop()
+
+    stats = batcher.stats()
+    assert (stats['requests'], stats['errors']) == (0, 1)
+
+
+def test_concurrent_requests_never_exceed_max_batch_size(batcher):
+    results = {}
+
+    def submit(i):
+        results[i] = batcher.submit(['a' * i, 'b', 'cc'])
+
+    threads = [threading.Thread(target=submit, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(results[i] == [float(i), 1.0, 2.0] for i in range(8))
+    stats = batcher.stats()
+    # 24 texts in batches of at most 4
+    assert stats['batches'] >= 6
+
+
+def test_score_texts_sends_chunks_to_service(service_url, batcher):
+    texts = ['word' * (i % 3) for i in range(9)] + [None]
+    assert score_texts(texts, service_url=service_url, chunk_size=4) == fake_score(texts)
+    assert batcher.stats()['requests'] == 3
+
+
+def test_score_texts_falls_back_when_service_is_down():
+    # Nothing listens on port 9 locally, so the whole input is scored in-process
+    scores = score_texts(['good news', None], model='textblob', service_url='http://127.0.0.1:9', timeout=0.5)
+    assert scores[0] > 0
+    assert scores[1] is None
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('talib')
+
+from scripts.timeframe_pyramid import OHLCV_AGGREGATION, TimeframePyramid
+
+
+def ohlcv(index, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(size=len(index)))
+    df = pd.DataFrame({
+        'Open': close + rng.normal(size=len(index)),
+        'High': close + 2,
+        'Low': close - 2,
+        'Close': close,
+        'Adj Close': close,
+        'Volume': rng.integers(1, 100, len(index)),
+    }, index=index)
+    df.index.name = 'Date'
+    return df
+
+
+def assert_levels_equal(left, right):
+    assert left.level_names == right.level_names
+    for name in left.level_names:
+        pd.testing.assert_frame_equal(left.level(name), right.level(name), check_dtype=False, check_freq=False)
+
+
+@pytest.mark.parametrize('freq, periods, levels', [
+    ('B', 1500, ['D', 'W', 'M']),
+    ('15min', 8000, ['native', '1h', 'D', 'W', 'M']),
+])
+def test_update_matches_full_rebuild(freq, periods, levels):
+    df = ohlcv(pd.date_range('2015-01-01', periods=periods, freq=freq))
+
+    pyramid = TimeframePyramid(df.iloc[:-40])
+    pyramid.update(df.iloc[-40:-20])
+    # Overlapping rows revise bars that were already loaded
+    pyramid.update(df.iloc[-25:])
+
+    assert pyramid.level_names == levels
+    assert_levels_equal(pyramid, TimeframePyramid(df))
+
+
+@pytest.mark.parametrize('level, rule', [('W', 'W-FRI'), ('M', 'ME')])
+def test_weekly_and_monthly_aggregation(level, rule):
+    # Thirty business days from 2024-01-01: the week ending Fri 2 Feb straddles the month end
+    df = ohlcv(pd.bdate_range('2024-01-01', periods=30))
+
+    bars = TimeframePyramid(df).level(level)
+    expected = df.resample(rule).agg(OHLCV_AGGREGATION)
+
+    pd.testing.assert_frame_equal(bars[list(OHLCV_AGGREGATION)], expected, check_dtype=False, check_freq=False)
+    assert {'SMA_50', 'RSI', 'MACD'} <= set(bars.columns)
+
+
+def test_monthly_update_across_week_straddling_month_end():
+    df = ohlcv(pd.bdate_range('2024-01-01', periods=30))
+
+    pyramid = TimeframePyramid(df.iloc[:20])
+    pyramid.update(df.iloc[20:])
+
+    monthly = pyramid.level('M')
+    expected = df.resample('ME').agg(OHLCV_AGGREGATION)
+    pd.testing.assert_frame_equal(monthly[list(OHLCV_AGGREGATION)], expected, check_dtype=False, check_freq=False)
+    assert monthly.loc['2024-01-31', 'Close'] == df.loc['2024-01-31', 'Close']